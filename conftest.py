@@ -0,0 +1 @@
+# Lets pytest import the top-level modules (main, consumer_harm_monte_carlo) from tests/
@@ -5,6 +5,12 @@ Analyzes potential consumer harm across various scenarios including hidden fees,
 service failures, and damages with claim denials.
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import repeat
+
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -16,8 +22,23 @@ from plotly.subplots import make_subplots
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set random seed for reproducibility
-np.random.seed(42)
+try:
+    from numba import guvectorize, njit, prange
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # PyArrow is optional; CSV export falls back to plain Python formatting
+    pa = None
+
+# Reproducibility: there is no global random state. Every simulation entry point takes a
+# `seed` (default RANDOM_SEED) and builds its own Generator from SeedSequence(seed), so a
+# given seed reproduces the same results regardless of what else ran before. An explicit
+# `rng` Generator can be passed instead; worker processes get streams spawned from it.
+RANDOM_SEED = 42
 
 # Configuration
 N_SIMULATIONS = 10000  # Number of simulated customers
@@ -33,106 +54,461 @@ PARAMS = {
     'average_damage_value': {'min': 500, 'mode': 2500, 'max': 10000}
 }
 
+# Policy scenarios compared in the scenario analysis
+SCENARIOS = {
+    'Status Quo': PARAMS,
+    'Moderate Reform': {
+        'base_service_cost': PARAMS['base_service_cost'],
+        'hidden_fees': {'min': 0, 'mode': 150, 'max': 500},  # Reduced hidden fees
+        'service_failure_prob': {'min': 0.10, 'mode': 0.20, 'max': 0.30},  # Better service
+        'claim_denial_prob': {'min': 0.40, 'mode': 0.60, 'max': 0.80},  # Fairer claims
+        'damage_occurrence_rate': PARAMS['damage_occurrence_rate'],
+        'average_damage_value': PARAMS['average_damage_value']
+    },
+    'Strong Reform': {
+        'base_service_cost': PARAMS['base_service_cost'],
+        'hidden_fees': {'min': 0, 'mode': 50, 'max': 200},  # Minimal hidden fees
+        'service_failure_prob': {'min': 0.05, 'mode': 0.10, 'max': 0.15},  # Excellent service
+        'claim_denial_prob': {'min': 0.20, 'mode': 0.35, 'max': 0.50},  # Fair claims
+        'damage_occurrence_rate': {'min': 0.03, 'mode': 0.08, 'max': 0.15},  # Better handling
+        'average_damage_value': PARAMS['average_damage_value']
+    }
+}
+
+# Plot sizes: histograms are pre-binned and scatter plots sub-sampled so rendering
+# cost does not grow with the number of simulations
+HISTOGRAM_BINS = 50
+MAX_SCATTER_POINTS = 3000
+
+# Larger runs are simulated in chunks of this many customers, each on its own stream
+# spawned from the caller's RNG, so results do not depend on the number of workers.
+# Starting worker processes costs seconds, so they only pay off for runs of tens of
+# millions of customers and are opt-in (n_workers > 1)
+CHUNK_SIZE = 2_000_000
+
+# Streaming statistics: customers are simulated in cache-sized blocks and quantiles are
+# read from a fixed-width histogram of total harm, so memory does not grow with n_sims
+STREAM_BLOCK_SIZE = 65536
+STREAM_BIN_WIDTH = 0.10  # dollars
+
 # Penalty cost for service failures (assumption)
-SERVICE_FAILURE_PENALTY = 1000
+SERVICE_FAILURE_PENALTY = np.float32(1000.0)
+
+# Simulation arrays are float32: dollar amounts need far fewer than 7 significant digits
+SIM_DTYPE = np.float32
+
+# Bernoulli events compare 21-bit integer uniforms against their probabilities; three
+# independent fields are packed into each 64-bit draw (resolution ~5e-7 per event)
+EVENT_BITS = 21
+_EVENT_SHIFTS = np.array([0, EVENT_BITS, 2 * EVENT_BITS], dtype=np.uint64)
+_EVENT_MASK = np.uint64((1 << EVENT_BITS) - 1)
 
-def triangular_sample(min_val, mode_val, max_val, size):
-    """Generate samples from triangular distribution"""
-    return np.random.triangular(min_val, mode_val, max_val, size)
+@dataclass
+class SimResults:
+    """
+    Per-customer simulation results, stored as one NumPy array per column.
+    Columns can also be looked up by name (results['total_harm']).
+    The service failure and damage harm columns are derived from the event masks on access.
+    """
+    service_cost: np.ndarray
+    hidden_fees: np.ndarray
+    service_failure: np.ndarray
+    damage_occurred: np.ndarray
+    damage_value: np.ndarray
+    claim_denied: np.ndarray
+    total_harm: np.ndarray
+    
+    # Exported columns, in output order
+    COLUMNS = ('service_cost', 'hidden_fees', 'service_failure', 'service_failure_harm',
+               'damage_occurred', 'damage_value', 'claim_denied', 'damage_harm', 'total_harm')
+    
+    def __getitem__(self, column):
+        return getattr(self, column)
+    
+    @property
+    def service_failure_harm(self):
+        return np.where(self.service_failure, SERVICE_FAILURE_PENALTY, SIM_DTYPE(0))
+    
+    @property
+    def damage_harm(self):
+        return np.where(self.damage_occurred & self.claim_denied, self.damage_value, SIM_DTYPE(0))
+    
+    def columns(self):
+        """All exported columns by name, including the derived harm components"""
+        return {column: getattr(self, column) for column in self.COLUMNS}
+    
+    def __len__(self):
+        return len(self.total_harm)
+    
+    @cached_property
+    def sorted_harm(self):
+        """Total harm sorted ascending; computed once and shared by statistics and plots"""
+        return np.sort(self.total_harm)
+    
+    def to_dataframe(self):
+        """Build a pandas DataFrame with one column per exported column"""
+        return pd.DataFrame(self.columns())
+    
+    def to_arrow(self):
+        """Build a pyarrow Table with one column per exported column"""
+        return pa.table(self.columns())
+    
+    def to_csv(self, path):
+        """
+        Write the raw simulation data straight from the column arrays, without a DataFrame.
+        Uses pyarrow's CSV writer when available, plain Python formatting otherwise; both
+        write the same file: an unquoted header, event flags as 0/1 and floats as their
+        shortest round-trip digits (no trailing '.0').
+        """
+        columns = {name: values.astype(np.int8) if values.dtype == bool else values
+                   for name, values in self.columns().items()}
+        with open(path, 'wb') as f:
+            # Header written by hand because Arrow quotes column names
+            f.write((','.join(columns) + '\n').encode())
+            if pa is not None:
+                pa_csv.write_csv(pa.table(columns), f, pa_csv.WriteOptions(include_header=False))
+                return
+            
+            text = [values.astype(str) if values.dtype == np.int8
+                    else [np.format_float_positional(value, trim='-') for value in values]
+                    for values in columns.values()]
+            f.writelines((','.join(row) + '\n').encode() for row in zip(*text))
+    
+    def to_parquet(self, path, compression='zstd'):
+        """Write the raw simulation data as Parquet (requires pyarrow)"""
+        if pa is None:
+            raise ImportError("Parquet export requires pyarrow")
+        pq.write_table(self.to_arrow(), path, compression=compression)
+
+# Order in which parameters are sampled (one row per parameter)
+PARAM_ORDER = [
+    'base_service_cost',
+    'hidden_fees',
+    'service_failure_prob',
+    'claim_denial_prob',
+    'damage_occurrence_rate',
+    'average_damage_value'
+]
+
+def pack_parameters(params):
+    """Triangular bounds of every parameter as a (len(PARAM_ORDER), 3) array of (min, mode, max)"""
+    return np.array([[params[k]['min'], params[k]['mode'], params[k]['max']] for k in PARAM_ORDER],
+                    dtype=SIM_DTYPE)
+
+if njit is not None:
+    @guvectorize(['void(float32[:], float32, float32, float32, float32[:])'],
+                 '(n),(),(),()->(n)', target='parallel', cache=True)
+    def _triangular_kernel(u, low, mode, high, out):
+        """Triangular inverse CDF per element, without the intermediate arrays of the NumPy path"""
+        span = high - low
+        split = (mode - low) / span
+        for i in range(u.shape[0]):
+            if u[i] < split:
+                out[i] = low + span * np.sqrt(u[i] * split)
+            else:
+                out[i] = high - span * np.sqrt((np.float32(1) - u[i]) * (np.float32(1) - split))
+
+def allocate_workspace(n_sims=N_SIMULATIONS, n_scenarios=1):
+    """Scratch buffer for the uniform draws, reusable across simulation calls of up to this size"""
+    return np.empty(len(PARAM_ORDER) * n_scenarios * n_sims, dtype=SIM_DTYPE)
 
-def run_monte_carlo_simulation(params=PARAMS, n_sims=N_SIMULATIONS):
+def make_rng(seed=RANDOM_SEED):
+    """Independent PCG64 Generator for `seed`"""
+    return np.random.default_rng(np.random.SeedSequence(seed))
+
+def _draw_uniforms(shape, rng, workspace=None):
+    """Uniform draws of `shape`, written into the front of `workspace` when one is given"""
+    n_values = int(np.prod(shape))
+    if workspace is None:
+        u = np.empty(shape, dtype=SIM_DTYPE)
+    elif workspace.dtype != SIM_DTYPE or workspace.size < n_values:
+        raise ValueError(f"workspace must be a {np.dtype(SIM_DTYPE).name} array "
+                         f"with at least {n_values:,} elements")
+    else:
+        u = workspace.reshape(-1)[:n_values].reshape(shape)
+    rng.random(dtype=SIM_DTYPE, out=u)
+    return u
+
+def sample_parameters(bounds, size, rng=None, workspace=None):
     """
-    Run Monte Carlo simulation for consumer harm
+    Generate triangular samples for every parameter in a single vectorized pass.
+    `bounds` is a packed (..., len(PARAM_ORDER), 3) array from pack_parameters, optionally
+    stacked over scenarios. Returns an array of shape (len(PARAM_ORDER), ..., size), so each
+    parameter's samples are one contiguous block.
+    Uses a compiled, parallel gufunc for the inverse CDF when Numba is installed.
+    The uniform draws go into `workspace` (see allocate_workspace) when one is given.
+    """
+    rng = make_rng() if rng is None else rng
+    lows, modes, highs = (np.moveaxis(bounds[..., i], -1, 0)[..., None] for i in range(3))
+    spans = highs - lows
+    splits = (modes - lows) / spans
+    
+    shape = lows.shape[:-1] + (size,)
+    u = _draw_uniforms(shape, rng, workspace)
+    
+    samples = np.empty(shape, dtype=SIM_DTYPE)
+    if njit is not None:
+        _triangular_kernel(u, lows[..., 0], modes[..., 0], highs[..., 0], samples)
+        return samples
+    
+    # Inverse CDF of the triangular distribution, applied to all parameters at once and
+    # computed in place: lows + spans*sqrt(u*splits) below the mode,
+    # highs - spans*sqrt((1-u)*(1-splits)) above it
+    below_mode = u < splits
+    np.subtract(1, u, out=samples)
+    samples *= 1 - splits
+    np.multiply(u, splits, out=samples, where=below_mode)
+    np.sqrt(samples, out=samples)
+    samples *= spans
+    np.add(lows, samples, out=samples, where=below_mode)
+    np.subtract(highs, samples, out=samples, where=~below_mode)
+    return samples
+
+def _compute_harm_numpy(hidden_fees, service_failures, damage_occurred, claims_denied, damage_values):
+    """Total harm via in-place masked adds, without materializing the harm components"""
+    total_harm = hidden_fees.copy()
+    np.add(total_harm, SERVICE_FAILURE_PENALTY, out=total_harm, where=service_failures)
+    np.add(total_harm, damage_values, out=total_harm, where=damage_occurred & claims_denied)
+    return total_harm
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _harm_kernel(hidden_fees, service_failures, damage_occurred, claims_denied,
+                     damage_values, penalty, total_harm):
+        """Fused per-customer harm loop; writes into the preallocated output array"""
+        for i in prange(hidden_fees.shape[0]):
+            sf_harm = penalty if service_failures[i] else np.float32(0)
+            dmg_harm = damage_values[i] if damage_occurred[i] and claims_denied[i] else np.float32(0)
+            total_harm[i] = hidden_fees[i] + sf_harm + dmg_harm
+
+def _compute_harm(hidden_fees, service_failures, damage_occurred, claims_denied, damage_values):
+    """
+    Calculate the total harm for every customer.
+    Uses a single fused, parallel Numba loop when Numba is installed.
+    """
+    if njit is None:
+        return _compute_harm_numpy(hidden_fees, service_failures, damage_occurred,
+                                   claims_denied, damage_values)
+    
+    # The kernel works on flat arrays; inputs are contiguous, so ravel() returns views
+    total_harm = np.empty_like(hidden_fees)
+    _harm_kernel(hidden_fees.ravel(), service_failures.ravel(), damage_occurred.ravel(),
+                 claims_denied.ravel(), damage_values.ravel(), SERVICE_FAILURE_PENALTY,
+                 total_harm.ravel())
+    return total_harm
+
+def _simulate_chunk(bounds, n_sims, rng, workspace=None):
+    """
+    Simulate `n_sims` customers for packed parameter `bounds` (optionally stacked over
+    scenarios); returns a dict of column arrays shaped (..., n_sims)
     """
     # Generate random samples for each parameter
-    service_costs = triangular_sample(
-        params['base_service_cost']['min'],
-        params['base_service_cost']['mode'],
-        params['base_service_cost']['max'],
-        n_sims
-    )
-    
-    hidden_fees = triangular_sample(
-        params['hidden_fees']['min'],
-        params['hidden_fees']['mode'],
-        params['hidden_fees']['max'],
-        n_sims
-    )
-    
-    service_failure_probs = triangular_sample(
-        params['service_failure_prob']['min'],
-        params['service_failure_prob']['mode'],
-        params['service_failure_prob']['max'],
-        n_sims
-    )
-    
-    claim_denial_probs = triangular_sample(
-        params['claim_denial_prob']['min'],
-        params['claim_denial_prob']['mode'],
-        params['claim_denial_prob']['max'],
-        n_sims
+    (service_costs, hidden_fees, service_failure_probs, claim_denial_probs,
+     damage_occurrence_rates, damage_values) = sample_parameters(bounds, n_sims, rng, workspace)
+    
+    # Simulate events: one 64-bit draw per customer is split into three 21-bit
+    # uniforms, each compared as an integer against its scaled probability
+    event_probs = np.stack([service_failure_probs, damage_occurrence_rates, claim_denial_probs])
+    thresholds = (event_probs * (1 << EVENT_BITS)).astype(np.uint32)
+    bits = rng.integers(0, 1 << (3 * EVENT_BITS), size=hidden_fees.shape, dtype=np.uint64)
+    shifts = _EVENT_SHIFTS.reshape((-1,) + (1,) * bits.ndim)
+    events = ((bits >> shifts) & _EVENT_MASK) < thresholds
+    service_failures, damage_occurred, claims_denied = events
+    
+    # Calculate total harm per customer; the components are derived by SimResults on demand
+    total_harm = _compute_harm(
+        hidden_fees, service_failures, damage_occurred, claims_denied, damage_values
     )
     
-    damage_occurrence_rates = triangular_sample(
-        params['damage_occurrence_rate']['min'],
-        params['damage_occurrence_rate']['mode'],
-        params['damage_occurrence_rate']['max'],
-        n_sims
-    )
-    
-    damage_values = triangular_sample(
-        params['average_damage_value']['min'],
-        params['average_damage_value']['mode'],
-        params['average_damage_value']['max'],
-        n_sims
-    )
-    
-    # Simulate events
-    service_failures = np.random.random(n_sims) < service_failure_probs
-    damage_occurred = np.random.random(n_sims) < damage_occurrence_rates
-    claims_denied = np.random.random(n_sims) < claim_denial_probs
-    
-    # Calculate harm components
-    service_failure_harm = service_failures * SERVICE_FAILURE_PENALTY
-    damage_harm = damage_occurred * damage_values * claims_denied
-    
-    # Total harm per customer
-    total_harm = hidden_fees + service_failure_harm + damage_harm
-    
-    # Create results dataframe
-    results = pd.DataFrame({
+    return {
         'service_cost': service_costs,
         'hidden_fees': hidden_fees,
         'service_failure': service_failures,
-        'service_failure_harm': service_failure_harm,
         'damage_occurred': damage_occurred,
         'damage_value': damage_values,
         'claim_denied': claims_denied,
-        'damage_harm': damage_harm,
         'total_harm': total_harm
-    })
-    
-    return results
+    }
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _fused_kernel(bounds, uniforms, event_bits, penalty, samples, events, total_harm):
+        """
+        Whole simulation in one parallel pass per customer: triangular inverse CDF for each
+        parameter, the three Bernoulli events from the packed 21-bit fields, and total harm.
+        `bounds` is (n_scenarios, len(PARAM_ORDER), 3); the other arrays are laid out as in
+        _simulate_chunk, with the scenario and customer axes flattened.
+        """
+        n_scenarios, n_params = bounds.shape[0], bounds.shape[1]
+        n_sims = event_bits.shape[0] // n_scenarios
+        scale = np.float32(1 << EVENT_BITS)
+        mask = np.uint64((1 << EVENT_BITS) - 1)
+        for i in prange(event_bits.shape[0]):
+            scenario = i // n_sims
+            for p in range(n_params):
+                low, mode, high = bounds[scenario, p, 0], bounds[scenario, p, 1], bounds[scenario, p, 2]
+                span = high - low
+                split = (mode - low) / span
+                u = uniforms[p, i]
+                if u < split:
+                    samples[p, i] = low + span * np.sqrt(u * split)
+                else:
+                    samples[p, i] = high - span * np.sqrt((np.float32(1) - u) * (np.float32(1) - split))
+            
+            # Same field order as _simulate_chunk: service failure, damage, claim denial
+            bits = event_bits[i]
+            service_failure = (bits & mask) < np.uint64(np.uint32(samples[2, i] * scale))
+            damage_occurred = ((bits >> np.uint64(EVENT_BITS)) & mask) < np.uint64(np.uint32(samples[4, i] * scale))
+            claim_denied = ((bits >> np.uint64(2 * EVENT_BITS)) & mask) < np.uint64(np.uint32(samples[3, i] * scale))
+            events[0, i] = service_failure
+            events[1, i] = damage_occurred
+            events[2, i] = claim_denied
+            
+            harm = samples[1, i]
+            if service_failure:
+                harm += penalty
+            if damage_occurred and claim_denied:
+                harm += samples[5, i]
+            total_harm[i] = harm
+
+def _simulate_chunk_fused(bounds, n_sims, rng, workspace=None):
+    """
+    _simulate_chunk as a single fused Numba kernel. Draws the same uniforms and event bits
+    from `rng` in the same order, so results are bit-identical to the unfused path.
+    """
+    scenario_shape = bounds.shape[:-2]
+    shape = scenario_shape + (n_sims,)
+    uniforms = _draw_uniforms((len(PARAM_ORDER),) + shape, rng, workspace)
+    event_bits = rng.integers(0, 1 << (3 * EVENT_BITS), size=shape, dtype=np.uint64)
+    
+    samples = np.empty((len(PARAM_ORDER),) + shape, dtype=SIM_DTYPE)
+    events = np.empty((3,) + shape, dtype=bool)
+    total_harm = np.empty(shape, dtype=SIM_DTYPE)
+    flat = (len(PARAM_ORDER), -1)
+    _fused_kernel(bounds.reshape((-1,) + bounds.shape[-2:]), uniforms.reshape(flat),
+                  event_bits.ravel(), SERVICE_FAILURE_PENALTY, samples.reshape(flat),
+                  events.reshape(3, -1), total_harm.ravel())
+    
+    (service_costs, hidden_fees, _, _, _, damage_values) = samples
+    service_failures, damage_occurred, claims_denied = events
+    return {
+        'service_cost': service_costs,
+        'hidden_fees': hidden_fees,
+        'service_failure': service_failures,
+        'damage_occurred': damage_occurred,
+        'damage_value': damage_values,
+        'claim_denied': claims_denied,
+        'total_harm': total_harm
+    }
+
+def _simulate(bounds, n_sims, rng, n_workers, workspace=None, fused=False):
+    """
+    Simulate in one pass straight from `rng`, or, above CHUNK_SIZE customers, in chunks
+    of CHUNK_SIZE on independent streams spawned from `rng`. The chunks run in-process
+    or across n_workers processes with the same results (worker processes allocate
+    their own scratch space, so `workspace` is only used in-process)
+    """
+    if fused and njit is None:
+        raise ImportError("fused simulation requires numba")
+    simulate_chunk = _simulate_chunk_fused if fused else _simulate_chunk
+    
+    if n_sims <= CHUNK_SIZE:
+        return simulate_chunk(bounds, n_sims, rng, workspace)
+    
+    n_chunks, remainder = divmod(n_sims, CHUNK_SIZE)
+    chunk_sizes = [CHUNK_SIZE] * n_chunks + ([remainder] if remainder else [])
+    streams = rng.spawn(len(chunk_sizes))
+    n_workers = min(n_workers, len(chunk_sizes))
+    if n_workers <= 1:
+        chunks = [simulate_chunk(bounds, size, stream, workspace)
+                  for size, stream in zip(chunk_sizes, streams)]
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+            chunks = list(executor.map(simulate_chunk, repeat(bounds), chunk_sizes, streams))
+    
+    return {column: np.concatenate([chunk[column] for chunk in chunks], axis=-1)
+            for column in chunks[0]}
+
+def run_monte_carlo_simulation(params=PARAMS, n_sims=N_SIMULATIONS, rng=None, n_workers=1,
+                               workspace=None, seed=RANDOM_SEED, fused=False):
+    """
+    Run Monte Carlo simulation for consumer harm.
+    Draws from `rng` (a numpy Generator) if given, otherwise from a fresh one for `seed`.
+    Runs above CHUNK_SIZE customers are split into chunks on independent streams spawned
+    from `rng`; with n_workers > 1 the chunks are simulated in separate processes.
+    Pass a `workspace` from allocate_workspace to reuse one scratch buffer across calls.
+    With fused=True (requires Numba) each chunk is simulated by one fused parallel kernel.
+    Returns a SimResults of per-customer arrays.
+    """
+    rng = make_rng(seed) if rng is None else rng
+    return SimResults(**_simulate(pack_parameters(params), n_sims, rng, n_workers, workspace, fused))
+
+def simulate_scenarios(scenarios, n_sims=N_SIMULATIONS, rng=None, n_workers=1, workspace=None,
+                       seed=RANDOM_SEED, fused=False):
+    """
+    Simulate several scenarios together in one vectorized pass over stacked
+    (n_scenarios, n_sims) arrays. Returns {scenario name: SimResults}.
+    Draws from `rng` if given, otherwise from a fresh Generator for `seed`.
+    """
+    rng = make_rng(seed) if rng is None else rng
+    bounds = np.stack([pack_parameters(params) for params in scenarios.values()])
+    columns = _simulate(bounds, n_sims, rng, n_workers, workspace, fused)
+    return {
+        name: SimResults(**{column: values[i] for column, values in columns.items()})
+        for i, name in enumerate(scenarios)
+    }
+
+def quantiles_from_sorted(sorted_values, qs):
+    """
+    Quantiles of an already sorted array by direct index lookup, using the same
+    linear interpolation as np.quantile's default method
+    """
+    positions = np.asarray(qs, dtype=np.float64) * (len(sorted_values) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, len(sorted_values) - 1)
+    lower_values = sorted_values[lower].astype(np.float64)
+    return lower_values + (positions - lower) * (sorted_values[upper] - lower_values)
 
 def calculate_statistics(results):
     """Calculate key statistics from simulation results"""
     harm = results['total_harm']
+    sorted_harm = results.sorted_harm
+    
+    # Order statistics are index lookups into the (cached) sorted harm array
+    min_harm, p10, p25, median, p75, p90, p95, p99, max_harm = quantiles_from_sorted(
+        sorted_harm, [0.0, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99, 1.0]
+    )
     
+    # Threshold counts are binary searches into the same sorted array
+    first_zero = np.searchsorted(sorted_harm, 0.0, side='left')
+    past_zero, past_1000, past_5000 = np.searchsorted(sorted_harm, [0.0, 1000.0, 5000.0], side='right')
+    
+    # Harm is stored as float32; accumulate reductions in float64 to keep totals accurate
+    return _summarize(
+        np.mean(harm, dtype=np.float64), np.std(harm, dtype=np.float64, ddof=1),
+        (min_harm, p10, p25, median, p75, p90, p95, p99, max_harm),
+        past_zero - first_zero, len(sorted_harm) - past_1000, len(sorted_harm) - past_5000
+    )
+
+def _summarize(mean, std, quantiles, n_zero, n_over_1000, n_over_5000):
+    """Statistics dict shared by calculate_statistics and calculate_streaming_statistics"""
+    min_harm, p10, p25, median, p75, p90, p95, p99, max_harm = quantiles
     stats_dict = {
-        'Mean Harm': harm.mean(),
-        'Median Harm': harm.median(),
-        'Std Dev': harm.std(),
-        'Min Harm': harm.min(),
-        'Max Harm': harm.max(),
-        '10th Percentile': harm.quantile(0.10),
-        '25th Percentile': harm.quantile(0.25),
-        '75th Percentile': harm.quantile(0.75),
-        '90th Percentile': harm.quantile(0.90),
-        '95th Percentile': harm.quantile(0.95),
-        '99th Percentile': harm.quantile(0.99),
-        'Customers with Zero Harm': (harm == 0).sum(),
-        'Customers with Harm > $1000': (harm > 1000).sum(),
-        'Customers with Harm > $5000': (harm > 5000).sum()
+        'Mean Harm': mean,
+        'Median Harm': median,
+        'Std Dev': std,
+        'Min Harm': min_harm,
+        'Max Harm': max_harm,
+        '10th Percentile': p10,
+        '25th Percentile': p25,
+        '75th Percentile': p75,
+        '90th Percentile': p90,
+        '95th Percentile': p95,
+        '99th Percentile': p99,
+        'Customers with Zero Harm': n_zero,
+        'Customers with Harm > $1000': n_over_1000,
+        'Customers with Harm > $5000': n_over_5000
     }
     
     # Industry-wide annual impact
@@ -141,8 +517,68 @@ def calculate_statistics(results):
     
     return stats_dict
 
-def create_visualizations(results):
-    """Create comprehensive visualizations"""
+def simulate_streaming(params=PARAMS, n_sims=N_SIMULATIONS, block=STREAM_BLOCK_SIZE, rng=None,
+                       seed=RANDOM_SEED):
+    """
+    Simulate `n_sims` customers in blocks of up to `block`, yielding each block's total harm.
+    Scratch space is reused between blocks, so memory stays O(block) however large n_sims is.
+    """
+    rng = make_rng(seed) if rng is None else rng
+    bounds = pack_parameters(params)
+    workspace = allocate_workspace(min(block, n_sims))
+    for start in range(0, n_sims, block):
+        yield _simulate_chunk(bounds, min(block, n_sims - start), rng, workspace)['total_harm']
+
+def calculate_streaming_statistics(params=PARAMS, n_sims=N_SIMULATIONS, block=STREAM_BLOCK_SIZE,
+                                   rng=None, seed=RANDOM_SEED):
+    """
+    Same statistics as calculate_statistics, accumulated block by block from simulate_streaming.
+    Mean and standard deviation are exact (Welford/Chan updates), as are the min, max and
+    threshold counts; other quantiles are interpolated from a histogram with STREAM_BIN_WIDTH
+    bins spanning [0, highest possible harm].
+    """
+    max_harm_bound = (params['hidden_fees']['max'] + SERVICE_FAILURE_PENALTY
+                      + params['average_damage_value']['max'])
+    n_bins = int(np.ceil(max_harm_bound / STREAM_BIN_WIDTH)) + 1
+    histogram = np.zeros(n_bins, dtype=np.int64)
+    count, mean, sq_dev = 0, 0.0, 0.0
+    min_harm, max_harm = np.inf, -np.inf
+    n_zero = n_over_1000 = n_over_5000 = 0
+    
+    for harm in simulate_streaming(params, n_sims, block, rng, seed):
+        # Merge this block's mean and sum of squared deviations into the running totals
+        block_mean = np.mean(harm, dtype=np.float64)
+        # Deviations in float64: NumPy 1.x would otherwise keep float32 harm - float64 scalar in float32
+        block_sq_dev = np.sum(np.square(np.subtract(harm, block_mean, dtype=np.float64)))
+        delta = block_mean - mean
+        total = count + harm.size
+        mean += delta * harm.size / total
+        sq_dev += block_sq_dev + delta ** 2 * count * harm.size / total
+        count = total
+        
+        bins = np.minimum((harm / STREAM_BIN_WIDTH).astype(np.intp), n_bins - 1)
+        histogram += np.bincount(bins, minlength=n_bins)
+        min_harm = min(min_harm, float(harm.min()))
+        max_harm = max(max_harm, float(harm.max()))
+        n_zero += np.count_nonzero(harm == 0)
+        n_over_1000 += np.count_nonzero(harm > 1000)
+        n_over_5000 += np.count_nonzero(harm > 5000)
+    
+    # Interior quantiles: locate the rank in the cumulative histogram and interpolate within its bin
+    cumulative = np.cumsum(histogram)
+    ranks = np.array([0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]) * (count - 1)
+    bins = np.searchsorted(cumulative, ranks, side='right')
+    below = cumulative[bins] - histogram[bins]
+    quantiles = np.clip((bins + (ranks - below + 0.5) / histogram[bins]) * STREAM_BIN_WIDTH,
+                        min_harm, max_harm)
+    
+    return _summarize(mean, np.sqrt(sq_dev / (count - 1)), (min_harm, *quantiles, max_harm),
+                      n_zero, n_over_1000, n_over_5000)
+
+def create_visualizations(results, stats=None):
+    """Create comprehensive visualizations (reusing precomputed `stats` when given)"""
+    stats = calculate_statistics(results) if stats is None else stats
+    mean_harm, median_harm = stats['Mean Harm'], stats['Median Harm']
     
     # Set style
     plt.style.use('seaborn-v0_8-darkgrid')
@@ -150,11 +586,13 @@ def create_visualizations(results):
     # Create figure with subplots
     fig = plt.figure(figsize=(20, 12))
     
-    # 1. Histogram of total harm
+    # 1. Histogram of total harm (binned by NumPy, drawn as bars)
     ax1 = plt.subplot(2, 3, 1)
-    plt.hist(results['total_harm'], bins=50, color='steelblue', alpha=0.7, edgecolor='black')
-    plt.axvline(results['total_harm'].mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: ${results["total_harm"].mean():.0f}')
-    plt.axvline(results['total_harm'].median(), color='green', linestyle='--', linewidth=2, label=f'Median: ${results["total_harm"].median():.0f}')
+    counts, edges = np.histogram(results['total_harm'], bins=HISTOGRAM_BINS)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            color='steelblue', alpha=0.7, edgecolor='black')
+    plt.axvline(mean_harm, color='red', linestyle='--', linewidth=2, label=f'Mean: ${mean_harm:.0f}')
+    plt.axvline(median_harm, color='green', linestyle='--', linewidth=2, label=f'Median: ${median_harm:.0f}')
     plt.xlabel('Total Consumer Harm ($)')
     plt.ylabel('Frequency')
     plt.title('Distribution of Consumer Harm')
@@ -174,7 +612,7 @@ def create_visualizations(results):
     
     # 3. Cumulative distribution
     ax3 = plt.subplot(2, 3, 3)
-    sorted_harm = np.sort(results['total_harm'])
+    sorted_harm = results.sorted_harm
     cumulative = np.arange(1, len(sorted_harm) + 1) / len(sorted_harm) * 100
     plt.plot(sorted_harm, cumulative, linewidth=2, color='darkblue')
     plt.xlabel('Total Consumer Harm ($)')
@@ -194,10 +632,13 @@ def create_visualizations(results):
     plt.pie(component_means, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
     plt.title('Average Harm Breakdown by Component')
     
-    # 5. Scatter plot: Service Cost vs Total Harm
+    # 5. Scatter plot: Service Cost vs Total Harm (random sub-sample of customers)
     ax5 = plt.subplot(2, 3, 5)
-    scatter = plt.scatter(results['service_cost'], results['total_harm'], 
-                         c=results['hidden_fees'], cmap='viridis', alpha=0.5, s=10)
+    sample_idx = np.random.default_rng(RANDOM_SEED).choice(
+        len(results), size=min(len(results), MAX_SCATTER_POINTS), replace=False
+    )
+    scatter = plt.scatter(results['service_cost'][sample_idx], results['total_harm'][sample_idx], 
+                         c=results['hidden_fees'][sample_idx], cmap='viridis', alpha=0.5, s=10)
     plt.xlabel('Base Service Cost ($)')
     plt.ylabel('Total Consumer Harm ($)')
     plt.title('Service Cost vs Total Harm (colored by Hidden Fees)')
@@ -206,7 +647,7 @@ def create_visualizations(results):
     # 6. Percentile chart
     ax6 = plt.subplot(2, 3, 6)
     percentiles = [10, 25, 50, 75, 90, 95, 99]
-    percentile_values = [results['total_harm'].quantile(p/100) for p in percentiles]
+    percentile_values = [median_harm if p == 50 else stats[f'{p}th Percentile'] for p in percentiles]
     plt.bar([str(p) + 'th' for p in percentiles], percentile_values, color='coral')
     plt.xlabel('Percentile')
     plt.ylabel('Harm Amount ($)')
@@ -218,22 +659,24 @@ def create_visualizations(results):
     plt.savefig('consumer_harm_analysis.png', dpi=300, bbox_inches='tight')
     plt.show()
 
-def create_interactive_visualizations(results):
-    """Create interactive Plotly visualizations"""
+def create_interactive_visualizations(results, stats=None):
+    """Create interactive Plotly visualizations (reusing precomputed `stats` when given)"""
+    stats = calculate_statistics(results) if stats is None else stats
     
     # Create subplots
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('Harm Distribution', 'Harm Components', 
                        'Cumulative Distribution', 'Scenario Comparison'),
-        specs=[[{'type': 'histogram'}, {'type': 'box'}],
+        specs=[[{'type': 'bar'}, {'type': 'box'}],
                [{'type': 'scatter'}, {'type': 'bar'}]]
     )
     
-    # 1. Interactive histogram
+    # 1. Interactive histogram (pre-binned, so only the bin counts are embedded)
+    counts, edges = np.histogram(results['total_harm'], bins=HISTOGRAM_BINS)
     fig.add_trace(
-        go.Histogram(x=results['total_harm'], nbinsx=50, name='Total Harm',
-                    marker_color='steelblue'),
+        go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name='Total Harm',
+               marker_color='steelblue'),
         row=1, col=1
     )
     
@@ -247,7 +690,7 @@ def create_interactive_visualizations(results):
         )
     
     # 3. Cumulative distribution
-    sorted_harm = np.sort(results['total_harm'])
+    sorted_harm = results.sorted_harm
     cumulative = np.arange(1, len(sorted_harm) + 1) / len(sorted_harm) * 100
     fig.add_trace(
         go.Scatter(x=sorted_harm, y=cumulative, mode='lines', name='Cumulative %',
@@ -257,9 +700,9 @@ def create_interactive_visualizations(results):
     
     # 4. Scenario comparison (example with different assumptions)
     scenarios = ['Status Quo', 'Moderate Reform', 'Strong Reform']
-    mean_harms = [results['total_harm'].mean(), 
-                  results['total_harm'].mean() * 0.6,  # 40% reduction
-                  results['total_harm'].mean() * 0.3]   # 70% reduction
+    mean_harms = [stats['Mean Harm'], 
+                  stats['Mean Harm'] * 0.6,  # 40% reduction
+                  stats['Mean Harm'] * 0.3]   # 70% reduction
     
     fig.add_trace(
         go.Bar(x=scenarios, y=mean_harms, name='Mean Harm by Scenario',
@@ -281,34 +724,13 @@ def create_interactive_visualizations(results):
     fig.write_html("consumer_harm_interactive.html")
     fig.show()
 
-def run_scenario_analysis():
-    """Run analysis for different scenarios"""
-    
-    scenarios = {
-        'Status Quo': PARAMS,
-        'Moderate Reform': {
-            'base_service_cost': PARAMS['base_service_cost'],
-            'hidden_fees': {'min': 0, 'mode': 150, 'max': 500},  # Reduced hidden fees
-            'service_failure_prob': {'min': 0.10, 'mode': 0.20, 'max': 0.30},  # Better service
-            'claim_denial_prob': {'min': 0.40, 'mode': 0.60, 'max': 0.80},  # Fairer claims
-            'damage_occurrence_rate': PARAMS['damage_occurrence_rate'],
-            'average_damage_value': PARAMS['average_damage_value']
-        },
-        'Strong Reform': {
-            'base_service_cost': PARAMS['base_service_cost'],
-            'hidden_fees': {'min': 0, 'mode': 50, 'max': 200},  # Minimal hidden fees
-            'service_failure_prob': {'min': 0.05, 'mode': 0.10, 'max': 0.15},  # Excellent service
-            'claim_denial_prob': {'min': 0.20, 'mode': 0.35, 'max': 0.50},  # Fair claims
-            'damage_occurrence_rate': {'min': 0.03, 'mode': 0.08, 'max': 0.15},  # Better handling
-            'average_damage_value': PARAMS['average_damage_value']
-        }
-    }
-    
+def run_scenario_analysis(rng=None, workspace=None, seed=RANDOM_SEED):
+    """Run analysis for different scenarios, simulated together in one batched pass"""
     scenario_results = {}
     
-    for scenario_name, scenario_params in scenarios.items():
+    for scenario_name, results in simulate_scenarios(SCENARIOS, rng=rng, workspace=workspace,
+                                                            seed=seed).items():
         print(f"\nRunning scenario: {scenario_name}")
-        results = run_monte_carlo_simulation(scenario_params)
         stats = calculate_statistics(results)
         scenario_results[scenario_name] = {
             'results': results,
@@ -326,9 +748,12 @@ def main():
     print("Consumer Harm Monte Carlo Simulation")
     print("=" * 50)
     
+    # One scratch buffer, sized for the batched scenario run, serves every simulation below
+    workspace = allocate_workspace(N_SIMULATIONS, len(SCENARIOS))
+    
     # Run base simulation
     print("\nRunning base simulation with {} iterations...".format(N_SIMULATIONS))
-    results = run_monte_carlo_simulation()
+    results = run_monte_carlo_simulation(workspace=workspace)
     
     # Calculate statistics
     stats = calculate_statistics(results)
@@ -346,15 +771,15 @@ def main():
     
     # Create visualizations
     print("\nGenerating visualizations...")
-    create_visualizations(results)
-    create_interactive_visualizations(results)
+    create_visualizations(results, stats)
+    create_interactive_visualizations(results, stats)
     
     # Run scenario analysis
     print("\nRunning scenario analysis...")
-    scenario_results = run_scenario_analysis()
+    scenario_results = run_scenario_analysis(workspace=workspace)
     
     # Export results to CSV
-    results.to_csv('monte_carlo_results.csv', index=False)
+    results.to_csv('monte_carlo_results.csv')
     
     # Create summary report
     with open('simulation_summary.txt', 'w') as f:
@@ -4,9 +4,9 @@ Export Monte Carlo Simulation Results to Excel
 Creates a comprehensive Excel workbook with multiple sheets, charts, and formatted tables
 """
 
-import pandas as pd
 import numpy as np
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.chart import (
@@ -14,161 +14,229 @@ from openpyxl.chart import (
     Reference, Series
 )
 from openpyxl.chart.axis import DateAxis
-from openpyxl.formatting.rule import ColorScaleRule, DataBarRule
+from openpyxl.formatting.rule import ColorScaleRule, DataBarRule, FormulaRule
+from openpyxl.writer.excel import ExcelWriter
+import argparse
+import cProfile
 import json
-from datetime import datetime
+import pstats
+import sys
+from zipfile import ZipFile, ZIP_DEFLATED
+from datetime import datetime, timezone
 import warnings
 warnings.filterwarnings('ignore')
 
 # Import the simulation functions
 from consumer_harm_monte_carlo import (
     run_monte_carlo_simulation, 
+    simulate_scenarios,
     calculate_statistics, 
+    quantiles_from_sorted,
     PARAMS, 
+    SCENARIOS,
     ANNUAL_TRANSACTIONS,
     N_SIMULATIONS
 )
 
+# Simulation columns shown on the Detailed Results sheet, in sheet order
+DETAIL_COLUMNS = [
+    'service_cost', 'hidden_fees', 'service_failure', 'service_failure_harm', 'damage_occurred',
+    'damage_value', 'claim_denied', 'damage_harm', 'total_harm'
+]
+DETAIL_FLAG_COLUMNS = ['service_failure', 'damage_occurred', 'claim_denied']
+
+# Shared styles: every cell references these same objects, so openpyxl registers each
+# style once instead of hashing a fresh Font/Fill per cell
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+TITLE_FONT = Font(bold=True, size=16)
+SUBTITLE_FONT = Font(bold=True, size=14)
+SECTION_FONT = Font(bold=True, size=12)
+BOLD_FONT = Font(bold=True)
+
+CURRENCY_FORMAT = '$#,##0.00'
+PERCENT_FORMAT = '0.0%'
+NUMBER_FORMAT = '#,##0'
+
+BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+# Color schemes
+GOOD_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+BAD_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+NEUTRAL_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+
+# Fill per harm tier (0: low, 1: moderate, 2: high)
+TIER_FILL = {0: GOOD_FILL, 1: NEUTRAL_FILL, 2: BAD_FILL}
+TIER_INTERPRETATION = {0: "Low harm", 1: "Moderate harm", 2: "High to extreme harm"}
+
+# Correlation matrix colors
+STRONG_CORR_FILL = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
+MODERATE_CORR_FILL = PatternFill(start_color="FFA500", end_color="FFA500", fill_type="solid")
+NEGATIVE_CORR_FILL = PatternFill(start_color="0000FF", end_color="0000FF", fill_type="solid")
+
+BASELINE_SCENARIO = 'Status Quo'
+
+def scenario_deltas(scenario_results):
+    """
+    Mean harm and annual impact per scenario as arrays (in scenario order), with
+    the reductions of each relative to the Status Quo baseline
+    """
+    names = list(scenario_results)
+    mean_harm = np.array([scenario_results[name]['stats']['Mean Harm'] for name in names])
+    annual_impact = np.array([scenario_results[name]['stats']['Annual Industry Impact (Mean)']
+                              for name in names])
+    baseline = names.index(BASELINE_SCENARIO)
+    
+    return {
+        'names': names,
+        'is_baseline': np.arange(len(names)) == baseline,
+        'mean_harm': mean_harm,
+        'annual_impact': annual_impact,
+        'reduction': 1 - mean_harm / mean_harm[baseline],
+        'impact_reduction': annual_impact[baseline] - annual_impact,
+    }
+
 class ExcelExporter:
-    def __init__(self, filename="Consumer_Harm_Analysis.xlsx"):
+    def __init__(self, filename="Consumer_Harm_Analysis.xlsx", compresslevel=1):
         self.filename = filename
-        self.wb = Workbook()
-        self.wb.remove(self.wb.active)  # Remove default sheet
-        
-        # Define styles
-        self.header_font = Font(bold=True, color="FFFFFF", size=12)
-        self.header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        self.header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        
-        self.title_font = Font(bold=True, size=16)
-        self.subtitle_font = Font(bold=True, size=14)
-        self.section_font = Font(bold=True, size=12)
-        
-        self.currency_format = '$#,##0.00'
-        self.percent_format = '0.0%'
-        self.number_format = '#,##0'
-        
-        self.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Color schemes
-        self.good_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        self.bad_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        self.neutral_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+        # Deflate level for the .xlsx archive; openpyxl always uses zlib's default (6),
+        # which costs far more time than it saves in size on a workbook this size
+        self.compresslevel = compresslevel
+        # Write-only workbook: rows are streamed to disk as they are appended instead of
+        # being kept as Cell objects, so every sheet is written strictly top to bottom
+        self.wb = Workbook(write_only=True)
+
+    def _cell(self, ws, value=None, font=None, fill=None, number_format=None, alignment=None,
+              border=None):
+        """Styled write-only cell; pass the shared module-level style objects"""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if number_format is not None:
+            cell.number_format = number_format
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
+
+    def _header_row(self, ws, headers, alignment=True, border=None):
+        """Row of header cells"""
+        return [self._cell(ws, header, font=HEADER_FONT, fill=HEADER_FILL,
+                           alignment=HEADER_ALIGNMENT if alignment else None, border=border)
+                for header in headers]
+
+    def _add_tier_formatting(self, ws, cell_range, tier_formulas):
+        """
+        Color `cell_range` with native conditional formatting rules that Excel evaluates,
+        rather than a fill per cell. `tier_formulas` maps tier -> formula (relative to the
+        range's top-left cell); rules are checked in order and the first match wins.
+        """
+        for tier, formula in tier_formulas.items():
+            ws.conditional_formatting.add(
+                cell_range, FormulaRule(formula=[formula], stopIfTrue=True, fill=TIER_FILL[tier])
+            )
+
+    def _create_sheet(self, title, column_widths):
+        """
+        Create a write-only sheet. Rows are streamed to the file as they are appended, so
+        column widths have to be set up front, before the first row.
+        """
+        ws = self.wb.create_sheet(title)
+        for column, width in column_widths.items():
+            ws.column_dimensions[column].width = width
+        return ws
+
+    def _append_blank_rows(self, ws, count):
+        for _ in range(count):
+            ws.append([])
 
     def create_summary_sheet(self, stats, scenario_results):
         """Create executive summary sheet"""
-        ws = self.wb.create_sheet("Executive Summary")
+        ws = self._create_sheet("Executive Summary",
+                                {'A': 35, 'B': 15, 'C': 15, 'D': 20, 'E': 20, 'F': 15})
         
         # Title
-        ws['A1'] = "Consumer Harm Monte Carlo Analysis"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:F1')
-        
-        ws['A2'] = f"Analysis Date: {datetime.now().strftime('%B %d, %Y')}"
-        ws['A3'] = f"Simulations: {N_SIMULATIONS:,} | Annual Transactions: {ANNUAL_TRANSACTIONS:,.0f}"
-        ws.merge_cells('A2:F2')
-        ws.merge_cells('A3:F3')
+        ws.append([self._cell(ws, "Consumer Harm Monte Carlo Analysis", font=TITLE_FONT)])
+        ws.append([f"Analysis Date: {datetime.now().strftime('%B %d, %Y')}"])
+        ws.append([f"Simulations: {N_SIMULATIONS:,} | Annual Transactions: {ANNUAL_TRANSACTIONS:,.0f}"])
+        ws.append([])
         
         # Key Findings Section
-        ws['A5'] = "KEY FINDINGS"
-        ws['A5'].font = self.subtitle_font
-        ws.merge_cells('A5:F5')
+        ws.append([self._cell(ws, "KEY FINDINGS", font=SUBTITLE_FONT)])
+        ws.append([])
         
         # Status Quo Statistics
-        row = 7
-        ws[f'A{row}'] = "Status Quo Analysis"
-        ws[f'A{row}'].font = self.section_font
-        row += 1
+        ws.append([self._cell(ws, "Status Quo Analysis", font=SECTION_FONT)])
         
         key_stats = [
-            ("Mean Consumer Harm", stats['Mean Harm'], self.currency_format),
-            ("Median Consumer Harm", stats['Median Harm'], self.currency_format),
-            ("95th Percentile Harm", stats['95th Percentile'], self.currency_format),
-            ("Maximum Harm Observed", stats['Max Harm'], self.currency_format),
+            ("Mean Consumer Harm", stats['Mean Harm'], CURRENCY_FORMAT),
+            ("Median Consumer Harm", stats['Median Harm'], CURRENCY_FORMAT),
+            ("95th Percentile Harm", stats['95th Percentile'], CURRENCY_FORMAT),
+            ("Maximum Harm Observed", stats['Max Harm'], CURRENCY_FORMAT),
             ("", "", ""),  # Blank row
-            ("Customers with Zero Harm", stats['Customers with Zero Harm'], self.number_format),
-            ("Customers with Harm > $1,000", stats['Customers with Harm > $1000'], self.number_format),
-            ("Customers with Harm > $5,000", stats['Customers with Harm > $5000'], self.number_format),
+            ("Customers with Zero Harm", stats['Customers with Zero Harm'], NUMBER_FORMAT),
+            ("Customers with Harm > $1,000", stats['Customers with Harm > $1000'], NUMBER_FORMAT),
+            ("Customers with Harm > $5,000", stats['Customers with Harm > $5000'], NUMBER_FORMAT),
             ("", "", ""),  # Blank row
-            ("Annual Industry Impact (Mean)", stats['Annual Industry Impact (Mean)'], self.currency_format),
-            ("Annual Industry Impact (95th %ile)", stats['Annual Industry Impact (95th %ile)'], self.currency_format),
+            ("Annual Industry Impact (Mean)", stats['Annual Industry Impact (Mean)'], CURRENCY_FORMAT),
+            ("Annual Industry Impact (95th %ile)", stats['Annual Industry Impact (95th %ile)'], CURRENCY_FORMAT),
         ]
         
         for stat_name, stat_value, format_str in key_stats:
             if stat_name:  # Skip blank rows
-                ws[f'A{row}'] = stat_name
-                ws[f'C{row}'] = stat_value
-                if format_str:
-                    ws[f'C{row}'].number_format = format_str
-                ws[f'C{row}'].font = Font(bold=True)
-            row += 1
+                ws.append([stat_name, None,
+                           self._cell(ws, stat_value, font=BOLD_FONT, number_format=format_str or None)])
+            else:
+                ws.append([])
         
         # Scenario Comparison
-        row += 2
-        ws[f'A{row}'] = "SCENARIO COMPARISON"
-        ws[f'A{row}'].font = self.subtitle_font
-        ws.merge_cells(f'A{row}:F{row}')
-        row += 2
+        self._append_blank_rows(ws, 2)
+        ws.append([self._cell(ws, "SCENARIO COMPARISON", font=SUBTITLE_FONT)])
+        ws.append([])
         
         # Headers for scenario comparison
         headers = ["Scenario", "Mean Harm", "Reduction %", "Annual Impact", "Impact Reduction"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-        row += 1
-        
-        # Scenario data
-        status_quo_mean = scenario_results['Status Quo']['stats']['Mean Harm']
-        status_quo_impact = scenario_results['Status Quo']['stats']['Annual Industry Impact (Mean)']
-        
-        for scenario_name, scenario_data in scenario_results.items():
-            ws[f'A{row}'] = scenario_name
-            ws[f'B{row}'] = scenario_data['stats']['Mean Harm']
-            ws[f'B{row}'].number_format = self.currency_format
-            
-            if scenario_name != 'Status Quo':
-                reduction = (1 - scenario_data['stats']['Mean Harm'] / status_quo_mean) * 100
-                ws[f'C{row}'] = reduction / 100
-                ws[f'C{row}'].number_format = self.percent_format
-                ws[f'C{row}'].fill = self.good_fill
-            
-            ws[f'D{row}'] = scenario_data['stats']['Annual Industry Impact (Mean)']
-            ws[f'D{row}'].number_format = self.currency_format
-            
-            if scenario_name != 'Status Quo':
-                impact_reduction = status_quo_impact - scenario_data['stats']['Annual Industry Impact (Mean)']
-                ws[f'E{row}'] = impact_reduction
-                ws[f'E{row}'].number_format = self.currency_format
-                ws[f'E{row}'].fill = self.good_fill
+        ws.append(self._header_row(ws, headers))
+        
+        # Scenario data; reductions are left blank on the baseline row
+        deltas = scenario_deltas(scenario_results)
+        
+        for scenario_name, is_baseline, mean_harm, annual_impact, reduction, impact_reduction in zip(
+                deltas['names'], deltas['is_baseline'].tolist(), deltas['mean_harm'].tolist(),
+                deltas['annual_impact'].tolist(), deltas['reduction'].tolist(),
+                deltas['impact_reduction'].tolist()):
+            if is_baseline:
+                reduction = impact_reduction = None
+            else:
+                reduction = self._cell(ws, reduction, fill=GOOD_FILL, number_format=PERCENT_FORMAT)
+                impact_reduction = self._cell(ws, impact_reduction, fill=GOOD_FILL,
+                                              number_format=CURRENCY_FORMAT)
             
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 35
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 20
-        ws.column_dimensions['E'].width = 20
-        ws.column_dimensions['F'].width = 15
+            ws.append([
+                scenario_name,
+                self._cell(ws, mean_harm, number_format=CURRENCY_FORMAT),
+                reduction,
+                self._cell(ws, annual_impact, number_format=CURRENCY_FORMAT),
+                impact_reduction
+            ])
 
     def create_detailed_results_sheet(self, results):
         """Create sheet with full simulation results"""
-        ws = self.wb.create_sheet("Detailed Results")
+        ws = self._create_sheet("Detailed Results", {'A': 12, **{chr(64 + col): 18 for col in range(2, 11)}})
         
         # Title
-        ws['A1'] = "Full Simulation Results (First 1000 Records)"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:J1')
-        
-        # Add data
-        row = 3
+        ws.append([self._cell(ws, "Full Simulation Results (First 1000 Records)", font=TITLE_FONT)])
+        ws.append([])
         
         # Headers
         headers = [
@@ -176,204 +244,176 @@ class ExcelExporter:
             "Service Failure Harm", "Damage Occurred", "Damage Value",
             "Claim Denied", "Damage Harm", "Total Harm"
         ]
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-            cell.border = self.border
-        
-        # Data (first 1000 rows to keep file size manageable)
-        for idx, row_data in results.head(1000).iterrows():
-            row += 1
-            ws.cell(row=row, column=1, value=idx + 1)
-            ws.cell(row=row, column=2, value=row_data['service_cost']).number_format = self.currency_format
-            ws.cell(row=row, column=3, value=row_data['hidden_fees']).number_format = self.currency_format
-            ws.cell(row=row, column=4, value="Yes" if row_data['service_failure'] else "No")
-            ws.cell(row=row, column=5, value=row_data['service_failure_harm']).number_format = self.currency_format
-            ws.cell(row=row, column=6, value="Yes" if row_data['damage_occurred'] else "No")
-            ws.cell(row=row, column=7, value=row_data['damage_value']).number_format = self.currency_format
-            ws.cell(row=row, column=8, value="Yes" if row_data['claim_denied'] else "No")
-            ws.cell(row=row, column=9, value=row_data['damage_harm']).number_format = self.currency_format
-            ws.cell(row=row, column=10, value=row_data['total_harm']).number_format = self.currency_format
-            
-            # Apply conditional formatting for total harm
-            if row_data['total_harm'] > 5000:
-                ws.cell(row=row, column=10).fill = self.bad_fill
-            elif row_data['total_harm'] > 1000:
-                ws.cell(row=row, column=10).fill = self.neutral_fill
-            else:
-                ws.cell(row=row, column=10).fill = self.good_fill
-        
-        # Adjust column widths
-        for col in range(1, 11):
-            if col == 1:
-                ws.column_dimensions[chr(64 + col)].width = 12
-            else:
-                ws.column_dimensions[chr(64 + col)].width = 18
+        ws.append(self._header_row(ws, headers, border=BORDER))
+        
+        # Data (first 1000 rows to keep file size manageable), sliced straight off the
+        # result arrays and pulled out as plain Python values in bulk
+        n_detail = min(len(results), 1000)
+        columns = {column: results[column][:n_detail].tolist() for column in DETAIL_COLUMNS}
+        
+        # Yes/No labels for all three event flags in one vectorized call
+        flags = np.stack([results[column][:n_detail] for column in DETAIL_FLAG_COLUMNS])
+        flag_labels = np.where(flags, "Yes", "No")
+        columns.update(zip(DETAIL_FLAG_COLUMNS, flag_labels.tolist()))
+        
+        def currency(value):
+            return self._cell(ws, value, number_format=CURRENCY_FORMAT)
+        
+        for number, values in zip(range(1, n_detail + 1), zip(*columns.values())):
+            (service_cost, hidden_fees, service_failure, service_failure_harm, damage_occurred,
+             damage_value, claim_denied, damage_harm, total_harm) = values
+            ws.append([
+                number,
+                currency(service_cost),
+                currency(hidden_fees),
+                service_failure,
+                currency(service_failure_harm),
+                damage_occurred,
+                currency(damage_value),
+                claim_denied,
+                currency(damage_harm),
+                currency(total_harm)
+            ])
+        
+        # Total harm tiers: above $5,000, above $1,000, the rest
+        self._add_tier_formatting(ws, f'J4:J{3 + n_detail}',
+                                  {2: 'J4>5000', 1: 'J4>1000', 0: 'J4<=1000'})
 
     def create_percentile_analysis_sheet(self, results):
         """Create percentile analysis sheet"""
-        ws = self.wb.create_sheet("Percentile Analysis")
+        ws = self._create_sheet("Percentile Analysis", {'A': 15, 'B': 15, 'C': 20, 'D': 15, 'E': 20})
         
-        ws['A1'] = "Consumer Harm Percentile Analysis"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:E1')
+        ws.append([self._cell(ws, "Consumer Harm Percentile Analysis", font=TITLE_FONT)])
+        ws.append([])
         
-        # Calculate percentiles
+        # Calculate percentiles as index lookups into the cached sorted harm array,
+        # which calculate_statistics has usually sorted already
         percentiles = [1, 5, 10, 25, 50, 75, 80, 85, 90, 95, 99]
+        sorted_harm = results.sorted_harm
+        harm_values = quantiles_from_sorted(sorted_harm, np.array(percentiles) / 100)
         
-        row = 3
         # Headers
         headers = ["Percentile", "Harm Amount", "Cumulative Customers", "% of Customers", "Interpretation"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
+        ws.append(self._header_row(ws, headers))
         
-        row += 1
         total_customers = len(results)
         
-        for p in percentiles:
-            harm_value = results['total_harm'].quantile(p/100)
+        # Interpretation tier: up to the 25th, up to the 75th, above
+        tiers = np.digitize(percentiles, [25, 75], right=True)
+        
+        for p, harm_value, tier in zip(percentiles, harm_values, tiers):
             cumulative_customers = int(total_customers * p / 100)
             
-            ws.cell(row=row, column=1, value=f"{p}th")
-            ws.cell(row=row, column=2, value=harm_value).number_format = self.currency_format
-            ws.cell(row=row, column=3, value=cumulative_customers).number_format = self.number_format
-            ws.cell(row=row, column=4, value=p/100).number_format = self.percent_format
-            
-            # Interpretation
-            if p <= 25:
-                interpretation = "Low harm"
-                fill = self.good_fill
-            elif p <= 75:
-                interpretation = "Moderate harm"
-                fill = self.neutral_fill
-            else:
-                interpretation = "High to extreme harm"
-                fill = self.bad_fill
-            
-            ws.cell(row=row, column=5, value=interpretation)
-            for col in range(1, 6):
-                ws.cell(row=row, column=col).fill = fill
-            
-            row += 1
+            ws.append([
+                f"{p}th",
+                self._cell(ws, harm_value, number_format=CURRENCY_FORMAT),
+                self._cell(ws, cumulative_customers, number_format=NUMBER_FORMAT),
+                self._cell(ws, p/100, number_format=PERCENT_FORMAT),
+                TIER_INTERPRETATION[tier]
+            ])
+        
+        # Whole rows are colored by tier, keyed on the "% of Customers" column
+        self._add_tier_formatting(ws, f'A4:E{3 + len(percentiles)}',
+                                  {0: '$D4<=0.25', 1: '$D4<=0.75', 2: '$D4>0.75'})
         
         # Add summary statistics
-        row += 2
-        ws[f'A{row}'] = "Distribution Insights"
-        ws[f'A{row}'].font = self.section_font
-        row += 1
+        self._append_blank_rows(ws, 2)
+        ws.append([self._cell(ws, "Distribution Insights", font=SECTION_FONT)])
         
+        # Every insight percentile is already in the table above
+        Q = dict(zip(percentiles, harm_values.tolist()))
         insights = [
-            f"50% of customers experience harm ≤ ${results['total_harm'].quantile(0.5):,.0f}",
-            f"25% of customers experience harm ≥ ${results['total_harm'].quantile(0.75):,.0f}",
-            f"10% of customers experience harm ≥ ${results['total_harm'].quantile(0.9):,.0f}",
-            f"5% of customers experience harm ≥ ${results['total_harm'].quantile(0.95):,.0f}",
-            f"1% of customers experience harm ≥ ${results['total_harm'].quantile(0.99):,.0f}",
+            f"50% of customers experience harm ≤ ${Q[50]:,.0f}",
+            f"25% of customers experience harm ≥ ${Q[75]:,.0f}",
+            f"10% of customers experience harm ≥ ${Q[90]:,.0f}",
+            f"5% of customers experience harm ≥ ${Q[95]:,.0f}",
+            f"1% of customers experience harm ≥ ${Q[99]:,.0f}",
         ]
         
         for insight in insights:
-            ws[f'A{row}'] = insight
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 20
+            ws.append([insight])
 
     def create_harm_components_sheet(self, results):
         """Create harm components breakdown sheet"""
-        ws = self.wb.create_sheet("Harm Components")
+        ws = self._create_sheet("Harm Components", {'A': 25, **{chr(64 + col): 18 for col in range(2, 7)}})
         
-        ws['A1'] = "Consumer Harm Components Analysis"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:F1')
+        ws.append([self._cell(ws, "Consumer Harm Components Analysis", font=TITLE_FONT)])
+        ws.append([])
         
-        # Component statistics
+        # Component statistics, each aggregate computed once over all three columns;
+        # a single sort per column yields both the median and the max
         components = {
-            'Hidden Fees': results['hidden_fees'],
-            'Service Failure Harm': results['service_failure_harm'],
-            'Damage Harm (Denied Claims)': results['damage_harm']
+            'Hidden Fees': 'hidden_fees',
+            'Service Failure Harm': 'service_failure_harm',
+            'Damage Harm (Denied Claims)': 'damage_harm'
         }
+        component_data = np.column_stack([results[column] for column in components.values()])
+        sorted_components = np.sort(component_data, axis=0)
+        means = component_data.mean(axis=0, dtype=np.float64)
+        medians = quantiles_from_sorted(sorted_components, 0.5)
+        maxes = sorted_components[-1]
+        affected = (component_data > 0).sum(axis=0)
         
-        row = 3
         # Headers
         headers = ["Component", "Mean", "Median", "Max", "% of Total", "Affected Customers"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-        
-        row += 1
-        total_mean_harm = results['total_harm'].mean()
-        
-        for component_name, component_data in components.items():
-            ws.cell(row=row, column=1, value=component_name)
-            ws.cell(row=row, column=2, value=component_data.mean()).number_format = self.currency_format
-            ws.cell(row=row, column=3, value=component_data.median()).number_format = self.currency_format
-            ws.cell(row=row, column=4, value=component_data.max()).number_format = self.currency_format
-            ws.cell(row=row, column=5, value=component_data.mean() / total_mean_harm).number_format = self.percent_format
-            ws.cell(row=row, column=6, value=(component_data > 0).sum()).number_format = self.number_format
-            row += 1
+        ws.append(self._header_row(ws, headers))
         
-        # Correlation matrix
-        row += 2
-        ws[f'A{row}'] = "Component Correlation Matrix"
-        ws[f'A{row}'].font = self.section_font
-        row += 2
+        total_mean_harm = results['total_harm'].mean(dtype=np.float64)
         
-        corr_data = results[['service_cost', 'hidden_fees', 'service_failure_harm', 
-                           'damage_harm', 'total_harm']].corr()
+        for i, component_name in enumerate(components):
+            ws.append([
+                component_name,
+                self._cell(ws, means[i], number_format=CURRENCY_FORMAT),
+                self._cell(ws, medians[i], number_format=CURRENCY_FORMAT),
+                self._cell(ws, maxes[i], number_format=CURRENCY_FORMAT),
+                self._cell(ws, means[i] / total_mean_harm, number_format=PERCENT_FORMAT),
+                self._cell(ws, affected[i], number_format=NUMBER_FORMAT)
+            ])
+        
+        # Correlation matrix
+        self._append_blank_rows(ws, 2)
+        ws.append([self._cell(ws, "Component Correlation Matrix", font=SECTION_FONT)])
+        ws.append([])
+        
+        corr_columns = ['service_cost', 'hidden_fees', 'service_failure_harm', 'damage_harm', 'total_harm']
+        # Single-precision is ample for a matrix displayed to two decimals: mirrored entries
+        # differ by at most ~3e-8. The diagonal is set to exactly 1 rather than left rounded
+        corr_input = np.column_stack([results[column].astype(np.float32, copy=False)
+                                      for column in corr_columns])
+        corr_data = np.corrcoef(corr_input, rowvar=False, dtype=np.float32)
+        np.fill_diagonal(corr_data, 1)
         
         # Headers
-        corr_headers = [''] + list(corr_data.columns)
-        for col, header in enumerate(corr_headers, 1):
-            if col > 1:
-                header = header.replace('_', ' ').title()
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = self.header_fill if col > 1 else None
+        ws.append([self._cell(ws, '', font=BOLD_FONT)] + [
+            self._cell(ws, header.replace('_', ' ').title(), font=BOLD_FONT, fill=HEADER_FILL)
+            for header in corr_columns
+        ])
         
         # Correlation values
-        for idx, row_label in enumerate(corr_data.index):
-            row += 1
-            ws.cell(row=row, column=1, value=row_label.replace('_', ' ').title())
-            ws.cell(row=row, column=1).font = Font(bold=True)
-            ws.cell(row=row, column=1).fill = self.header_fill
+        for row_label, corr_row in zip(corr_columns, corr_data.tolist()):
+            row_cells = [self._cell(ws, row_label.replace('_', ' ').title(),
+                                    font=BOLD_FONT, fill=HEADER_FILL)]
             
-            for col_idx, value in enumerate(corr_data.iloc[idx], 2):
-                cell = ws.cell(row=row, column=col_idx, value=value)
-                cell.number_format = '0.00'
-                
+            for value in corr_row:
                 # Color scale for correlation
                 if value > 0.7:
-                    cell.fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
+                    fill = STRONG_CORR_FILL
                 elif value > 0.3:
-                    cell.fill = PatternFill(start_color="FFA500", end_color="FFA500", fill_type="solid")
+                    fill = MODERATE_CORR_FILL
                 elif value < -0.3:
-                    cell.fill = PatternFill(start_color="0000FF", end_color="0000FF", fill_type="solid")
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 25
-        for col in range(2, 7):
-            ws.column_dimensions[chr(64 + col)].width = 18
+                    fill = NEGATIVE_CORR_FILL
+                else:
+                    fill = None
+                row_cells.append(self._cell(ws, value, fill=fill, number_format='0.00'))
+            
+            ws.append(row_cells)
 
     def create_scenario_comparison_sheet(self, scenario_results):
         """Create detailed scenario comparison sheet"""
-        ws = self.wb.create_sheet("Scenario Comparison")
+        ws = self._create_sheet("Scenario Comparison", {'A': 30, **{chr(64 + col): 20 for col in range(2, 8)}})
         
-        ws['A1'] = "Reform Scenario Impact Analysis"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:G1')
-        
-        row = 3
+        ws.append([self._cell(ws, "Reform Scenario Impact Analysis", font=TITLE_FONT)])
+        ws.append([])
         
         # Create comparison table
         scenarios = list(scenario_results.keys())
@@ -386,41 +426,35 @@ class ExcelExporter:
         
         # Headers
         headers = ['Metric'] + scenarios
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-        
-        row += 1
+        ws.append(self._header_row(ws, headers))
         
         # Data
         for metric in metrics:
-            ws.cell(row=row, column=1, value=metric)
-            ws.cell(row=row, column=1).font = Font(bold=True)
+            row_cells = [self._cell(ws, metric, font=BOLD_FONT)]
             
             for col, scenario in enumerate(scenarios, 2):
                 value = scenario_results[scenario]['stats'][metric]
-                cell = ws.cell(row=row, column=col, value=value)
                 
                 if '$' in metric or 'Harm' in metric or 'Impact' in metric:
-                    cell.number_format = self.currency_format
+                    number_format = CURRENCY_FORMAT
                 else:
-                    cell.number_format = self.number_format
+                    number_format = NUMBER_FORMAT
                 
                 # Color coding for improvements
+                fill = None
                 if col > 2 and scenario != 'Status Quo':
                     status_quo_value = scenario_results['Status Quo']['stats'][metric]
                     if 'Customers with' in metric or 'Harm' in metric:
                         if value < status_quo_value:
-                            cell.fill = self.good_fill
-            row += 1
+                            fill = GOOD_FILL
+                
+                row_cells.append(self._cell(ws, value, fill=fill, number_format=number_format))
+            ws.append(row_cells)
         
         # Cost-Benefit Analysis
-        row += 2
-        ws[f'A{row}'] = "Cost-Benefit Analysis"
-        ws[f'A{row}'].font = self.section_font
-        row += 2
+        self._append_blank_rows(ws, 2)
+        ws.append([self._cell(ws, "Cost-Benefit Analysis", font=SECTION_FONT)])
+        ws.append([])
         
         # Implementation costs (example values)
         implementation_costs = {
@@ -430,63 +464,73 @@ class ExcelExporter:
         }
         
         headers = ['Scenario', 'Annual Consumer Benefit', 'Implementation Cost', 'Net Benefit', 'ROI']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-        
-        row += 1
-        status_quo_impact = scenario_results['Status Quo']['stats']['Annual Industry Impact (Mean)']
-        
-        for scenario in scenarios:
-            ws.cell(row=row, column=1, value=scenario)
-            
-            current_impact = scenario_results[scenario]['stats']['Annual Industry Impact (Mean)']
-            benefit = status_quo_impact - current_impact if scenario != 'Status Quo' else 0
-            cost = implementation_costs[scenario]
-            net_benefit = benefit - cost
-            roi = (benefit / cost - 1) if cost > 0 else 0
-            
-            ws.cell(row=row, column=2, value=benefit).number_format = self.currency_format
-            ws.cell(row=row, column=3, value=cost).number_format = self.currency_format
-            ws.cell(row=row, column=4, value=net_benefit).number_format = self.currency_format
-            ws.cell(row=row, column=5, value=roi).number_format = self.percent_format
-            
-            if net_benefit > 0:
-                for col in range(2, 6):
-                    ws.cell(row=row, column=col).fill = self.good_fill
-            
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        for col in range(2, 8):
-            ws.column_dimensions[chr(64 + col)].width = 20
+        ws.append(self._header_row(ws, headers, alignment=False))
+        
+        # Benefits, net benefits and ROIs for all scenarios at once
+        deltas = scenario_deltas(scenario_results)
+        benefits = deltas['impact_reduction']
+        costs = np.array([implementation_costs[scenario] for scenario in scenarios], dtype=np.float64)
+        net_benefits = benefits - costs
+        rois = np.divide(benefits, costs, out=np.ones_like(benefits), where=costs > 0) - 1
+        
+        for scenario, benefit, cost, net_benefit, roi in zip(
+                scenarios, benefits.tolist(), costs.tolist(), net_benefits.tolist(), rois.tolist()):
+            fill = GOOD_FILL if net_benefit > 0 else None
+            ws.append([
+                scenario,
+                self._cell(ws, benefit, fill=fill, number_format=CURRENCY_FORMAT),
+                self._cell(ws, cost, fill=fill, number_format=CURRENCY_FORMAT),
+                self._cell(ws, net_benefit, fill=fill, number_format=CURRENCY_FORMAT),
+                self._cell(ws, roi, fill=fill, number_format=PERCENT_FORMAT)
+            ])
 
     def create_charts_sheet(self, results, scenario_results):
         """Create sheet with charts"""
-        ws = self.wb.create_sheet("Charts")
+        ws = self._create_sheet("Charts", {})
         
-        ws['A1'] = "Visual Analysis"
-        ws['A1'].font = self.title_font
+        ws.append([self._cell(ws, "Visual Analysis", font=TITLE_FONT)])
+        ws.append([])
         
         # Prepare data for charts
         # 1. Harm Distribution Data (binned for chart)
-        bins = [0, 100, 500, 1000, 2000, 5000, 10000, float('inf')]
+        bins = np.array([0, 100, 500, 1000, 2000, 5000, 10000, np.inf])
         labels = ['$0-100', '$100-500', '$500-1k', '$1k-2k', '$2k-5k', '$5k-10k', '>$10k']
-        harm_dist = pd.cut(results['total_harm'], bins=bins, labels=labels).value_counts().sort_index()
+        counts, _ = np.histogram(results['total_harm'], bins=bins)
         
-        # Write distribution data
-        ws['A3'] = "Harm Distribution"
-        ws['A3'].font = self.section_font
-        ws['A4'] = "Range"
-        ws['B4'] = "Count"
+        # 2. Scenario Comparison Data
+        deltas = scenario_deltas(scenario_results)
         
-        row = 5
-        for label, count in harm_dist.items():
-            ws[f'A{row}'] = str(label)
-            ws[f'B{row}'] = int(count)
-            row += 1
+        # 3. Component Breakdown Data
+        component_means = [
+            results[column].mean(dtype=np.float64)
+            for column in ('hidden_fees', 'service_failure_harm', 'damage_harm')
+        ]
+        
+        blocks = [
+            ("Harm Distribution", ["Range", "Count"],
+             zip(labels, counts.tolist())),
+            ("Scenario Comparison", ["Scenario", "Mean Harm", "Annual Impact (Millions)"],
+             zip(deltas['names'], deltas['mean_harm'].tolist(),
+                 (deltas['annual_impact'] / 1_000_000).tolist())),
+            ("Harm Components", ["Component", "Average Amount"],
+             zip(['Hidden Fees', 'Service Failures', 'Denied Claims'], component_means)),
+        ]
+        
+        # Write all chart source data as one contiguous block from row 3, one blank row
+        # between tables, remembering each table's header and last data row
+        row = 3
+        spans = []
+        for title, header, data_rows in blocks:
+            ws.append([self._cell(ws, title, font=SECTION_FONT)])
+            ws.append(header)
+            n_rows = 0
+            for data_row in data_rows:
+                ws.append(list(data_row))
+                n_rows += 1
+            ws.append([])
+            spans.append((row + 1, row + 1 + n_rows))
+            row += n_rows + 3
+        (dist_header, dist_last), (scen_header, scen_last), (comp_header, comp_last) = spans
         
         # Create bar chart for distribution
         chart1 = BarChart()
@@ -496,27 +540,13 @@ class ExcelExporter:
         chart1.y_axis.title = 'Number of Customers'
         chart1.x_axis.title = 'Harm Amount Range'
         
-        data = Reference(ws, min_col=2, min_row=4, max_row=row-1, max_col=2)
-        cats = Reference(ws, min_col=1, min_row=5, max_row=row-1)
+        data = Reference(ws, min_col=2, min_row=dist_header, max_row=dist_last, max_col=2)
+        cats = Reference(ws, min_col=1, min_row=dist_header + 1, max_row=dist_last)
         chart1.add_data(data, titles_from_data=True)
         chart1.set_categories(cats)
         chart1.shape = 4
         ws.add_chart(chart1, "D3")
         
-        # 2. Scenario Comparison Chart
-        ws['A15'] = "Scenario Comparison"
-        ws['A15'].font = self.section_font
-        ws['A16'] = "Scenario"
-        ws['B16'] = "Mean Harm"
-        ws['C16'] = "Annual Impact (Millions)"
-        
-        row = 17
-        for scenario, data in scenario_results.items():
-            ws[f'A{row}'] = scenario
-            ws[f'B{row}'] = data['stats']['Mean Harm']
-            ws[f'C{row}'] = data['stats']['Annual Industry Impact (Mean)'] / 1_000_000
-            row += 1
-        
         # Create comparison chart
         chart2 = BarChart()
         chart2.type = "col"
@@ -525,34 +555,16 @@ class ExcelExporter:
         chart2.y_axis.title = 'Mean Harm ($)'
         chart2.x_axis.title = 'Scenario'
         
-        data = Reference(ws, min_col=2, min_row=16, max_row=row-1, max_col=2)
-        cats = Reference(ws, min_col=1, min_row=17, max_row=row-1)
+        data = Reference(ws, min_col=2, min_row=scen_header, max_row=scen_last, max_col=2)
+        cats = Reference(ws, min_col=1, min_row=scen_header + 1, max_row=scen_last)
         chart2.add_data(data, titles_from_data=True)
         chart2.set_categories(cats)
         ws.add_chart(chart2, "D15")
         
-        # 3. Component Breakdown Pie Chart
-        ws['A27'] = "Harm Components"
-        ws['A27'].font = self.section_font
-        ws['A28'] = "Component"
-        ws['B28'] = "Average Amount"
-        
-        components = [
-            ('Hidden Fees', results['hidden_fees'].mean()),
-            ('Service Failures', results['service_failure_harm'].mean()),
-            ('Denied Claims', results['damage_harm'].mean())
-        ]
-        
-        row = 29
-        for comp_name, comp_value in components:
-            ws[f'A{row}'] = comp_name
-            ws[f'B{row}'] = comp_value
-            row += 1
-        
         # Create pie chart
         pie = PieChart()
-        labels = Reference(ws, min_col=1, min_row=29, max_row=31)
-        data = Reference(ws, min_col=2, min_row=28, max_row=31)
+        labels = Reference(ws, min_col=1, min_row=comp_header + 1, max_row=comp_last)
+        data = Reference(ws, min_col=2, min_row=comp_header, max_row=comp_last)
         pie.add_data(data, titles_from_data=True)
         pie.set_categories(labels)
         pie.title = "Average Harm by Component"
@@ -560,67 +572,48 @@ class ExcelExporter:
 
     def create_parameters_sheet(self):
         """Create sheet documenting simulation parameters"""
-        ws = self.wb.create_sheet("Parameters")
+        ws = self._create_sheet("Parameters", {'A': 30, 'B': 15, 'C': 20, 'D': 15})
         
-        ws['A1'] = "Monte Carlo Simulation Parameters"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:D1')
+        ws.append([self._cell(ws, "Monte Carlo Simulation Parameters", font=TITLE_FONT)])
+        ws.append([])
         
-        ws['A3'] = "Simulation Configuration"
-        ws['A3'].font = self.section_font
+        ws.append([self._cell(ws, "Simulation Configuration", font=SECTION_FONT)])
         
-        row = 4
         configs = [
-            ("Number of Simulations", N_SIMULATIONS, self.number_format),
-            ("Annual Transactions", ANNUAL_TRANSACTIONS, self.number_format),
-            ("Service Failure Penalty", 1000, self.currency_format),
+            ("Number of Simulations", N_SIMULATIONS, NUMBER_FORMAT),
+            ("Annual Transactions", ANNUAL_TRANSACTIONS, NUMBER_FORMAT),
+            ("Service Failure Penalty", 1000, CURRENCY_FORMAT),
             ("Random Seed", 42, None)
         ]
         
         for config_name, config_value, format_str in configs:
-            ws[f'A{row}'] = config_name
-            ws[f'C{row}'] = config_value
-            if format_str:
-                ws[f'C{row}'].number_format = format_str
-            row += 1
+            ws.append([config_name, None, self._cell(ws, config_value, number_format=format_str)])
         
-        row += 1
-        ws[f'A{row}'] = "Distribution Parameters (Triangular)"
-        ws[f'A{row}'].font = self.section_font
-        row += 1
+        ws.append([])
+        ws.append([self._cell(ws, "Distribution Parameters (Triangular)", font=SECTION_FONT)])
         
         # Headers
         headers = ["Parameter", "Minimum", "Mode (Most Likely)", "Maximum"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-        
-        row += 1
+        ws.append(self._header_row(ws, headers))
         
         # Parameters
         for param_name, param_values in PARAMS.items():
-            ws[f'A{row}'] = param_name.replace('_', ' ').title()
-            ws[f'B{row}'] = param_values['min']
-            ws[f'C{row}'] = param_values['mode']
-            ws[f'D{row}'] = param_values['max']
-            
             # Format based on parameter type
             if 'cost' in param_name or 'fee' in param_name or 'value' in param_name:
-                for col in range(2, 5):
-                    ws.cell(row=row, column=col).number_format = self.currency_format
+                number_format = CURRENCY_FORMAT
             elif 'prob' in param_name or 'rate' in param_name:
-                for col in range(2, 5):
-                    ws.cell(row=row, column=col).number_format = self.percent_format
+                number_format = PERCENT_FORMAT
+            else:
+                number_format = None
             
-            row += 1
+            ws.append([param_name.replace('_', ' ').title()] + [
+                self._cell(ws, param_values[key], number_format=number_format)
+                for key in ('min', 'mode', 'max')
+            ])
         
         # Add notes
-        row += 2
-        ws[f'A{row}'] = "Notes:"
-        ws[f'A{row}'].font = Font(bold=True)
-        row += 1
+        self._append_blank_rows(ws, 2)
+        ws.append([self._cell(ws, "Notes:", font=BOLD_FONT)])
         
         notes = [
             "• Triangular distributions used to model most likely scenarios with uncertainty",
@@ -630,55 +623,36 @@ class ExcelExporter:
         ]
         
         for note in notes:
-            ws[f'A{row}'] = note
-            ws.merge_cells(f'A{row}:D{row}')
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 15
+            ws.append([note])
 
     def save_workbook(self):
         """Save the completed workbook"""
-        self.wb.save(self.filename)
+        # Follows Workbook.save (empty write-only guard, modified timestamp as openpyxl's
+        # save_workbook sets it) but opens the archive itself to pass our compression level;
+        # the read-only check is skipped since this workbook is always write-only
+        if self.wb.write_only and not self.wb.worksheets:
+            self.wb.create_sheet()
+        self.wb.properties.modified = datetime.now(timezone.utc).replace(tzinfo=None)
+        with ZipFile(self.filename, 'w', ZIP_DEFLATED, allowZip64=True,
+                     compresslevel=self.compresslevel) as archive:
+            ExcelWriter(self.wb, archive).save()
         print(f"Excel file saved as: {self.filename}")
 
-def main():
-    """Main execution function"""
+def export_report(fused=False, n_workers=1):
+    """Run the simulations and write the Excel report and raw-data CSV"""
     print("Generating Excel report from Monte Carlo simulation...")
     print("=" * 50)
     
     # Run simulations
     print("\nRunning base simulation...")
-    results = run_monte_carlo_simulation()
+    results = run_monte_carlo_simulation(fused=fused)
     stats = calculate_statistics(results)
     
     print("Running scenario analysis...")
-    scenarios = {
-        'Status Quo': PARAMS,
-        'Moderate Reform': {
-            'base_service_cost': PARAMS['base_service_cost'],
-            'hidden_fees': {'min': 0, 'mode': 150, 'max': 500},
-            'service_failure_prob': {'min': 0.10, 'mode': 0.20, 'max': 0.30},
-            'claim_denial_prob': {'min': 0.40, 'mode': 0.60, 'max': 0.80},
-            'damage_occurrence_rate': PARAMS['damage_occurrence_rate'],
-            'average_damage_value': PARAMS['average_damage_value']
-        },
-        'Strong Reform': {
-            'base_service_cost': PARAMS['base_service_cost'],
-            'hidden_fees': {'min': 0, 'mode': 50, 'max': 200},
-            'service_failure_prob': {'min': 0.05, 'mode': 0.10, 'max': 0.15},
-            'claim_denial_prob': {'min': 0.20, 'mode': 0.35, 'max': 0.50},
-            'damage_occurrence_rate': {'min': 0.03, 'mode': 0.08, 'max': 0.15},
-            'average_damage_value': PARAMS['average_damage_value']
-        }
-    }
-    
     scenario_results = {}
-    for scenario_name, scenario_params in scenarios.items():
-        scenario_res = run_monte_carlo_simulation(scenario_params, n_sims=N_SIMULATIONS)
+    for scenario_name, scenario_res in simulate_scenarios(SCENARIOS, n_sims=N_SIMULATIONS,
+                                                          n_workers=n_workers,
+                                                          fused=fused).items():
         scenario_stats = calculate_statistics(scenario_res)
         scenario_results[scenario_name] = {
             'results': scenario_res,
@@ -714,7 +688,7 @@ def main():
     exporter.save_workbook()
     
     # Also save raw data as CSV for additional analysis
-    results.to_csv('monte_carlo_raw_data.csv', index=False)
+    results.to_csv('monte_carlo_raw_data.csv')
     print("Raw data also saved as: monte_carlo_raw_data.csv")
     
     print("\n✅ Excel report generation complete!")
@@ -727,5 +701,29 @@ def main():
     print("  6. Charts - Visual representations")
     print("  7. Parameters - Complete documentation")
 
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Export Monte Carlo simulation results to Excel")
+    parser.add_argument('--numba', action='store_true',
+                        help="simulate with the fused Numba kernel (requires numba)")
+    parser.add_argument('--profile', action='store_true',
+                        help="run under cProfile and print the top 25 functions by cumulative time")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for the scenario simulation (default: 1, in-process)")
+    args = parser.parse_args()
+    
+    if not args.profile:
+        export_report(fused=args.numba, n_workers=args.workers)
+        return
+    
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        export_report(fused=args.numba, n_workers=args.workers)
+    finally:
+        profiler.disable()
+        print("\nProfile (top 25 by cumulative time):")
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(25)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,8 +4,14 @@ Standalone Monte Carlo Simulation - All functionality in one file
 This combines the simulation, Excel export, and main runner
 """
 
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend, selected before pyplot is imported
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
@@ -17,14 +23,34 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set random seed for reproducibility
-np.random.seed(42)
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # PyArrow is optional; the raw-data CSV falls back to pandas
+    pa = None
+
+# Random seed for reproducibility; every draw comes from one PCG64 Generator
+RANDOM_SEED = 42
+RNG = np.random.default_rng(RANDOM_SEED)
 
 # Configuration
 N_SIMULATIONS = 10000  # Number of simulated customers
 ANNUAL_TRANSACTIONS = 1.73e6  # 1.73 million transactions per year
 SERVICE_FAILURE_PENALTY = 1000
 
+# Simulation arrays are single precision: dollar amounts well under $20k need nothing
+# more, and it halves the memory traffic. Statistics are accumulated in float64.
+SIM_DTYPE = np.float32
+
+# Bernoulli events compare a raw uint32 draw against probability * 2**32
+EVENT_SCALE = 2.0 ** 32
+EVENT_MAX = np.float64(2 ** 32 - 1)
+
 # Distribution parameters (using triangular distributions)
 PARAMS = {
     'base_service_cost': {'min': 2500, 'mode': 3200, 'max': 4000},
@@ -35,69 +61,173 @@ PARAMS = {
     'average_damage_value': {'min': 500, 'mode': 2500, 'max': 10000}
 }
 
-def triangular_sample(min_val, mode_val, max_val, size):
-    """Generate samples from triangular distribution"""
-    return np.random.triangular(min_val, mode_val, max_val, size)
+# Reform scenarios compared against the status quo
+SCENARIOS = {
+    'Status Quo': PARAMS,
+    'Moderate Reform': {
+        'base_service_cost': PARAMS['base_service_cost'],
+        'hidden_fees': {'min': 0, 'mode': 150, 'max': 500},
+        'service_failure_prob': {'min': 0.10, 'mode': 0.20, 'max': 0.30},
+        'claim_denial_prob': {'min': 0.40, 'mode': 0.60, 'max': 0.80},
+        'damage_occurrence_rate': PARAMS['damage_occurrence_rate'],
+        'average_damage_value': PARAMS['average_damage_value']
+    },
+    'Strong Reform': {
+        'base_service_cost': PARAMS['base_service_cost'],
+        'hidden_fees': {'min': 0, 'mode': 50, 'max': 200},
+        'service_failure_prob': {'min': 0.05, 'mode': 0.10, 'max': 0.15},
+        'claim_denial_prob': {'min': 0.20, 'mode': 0.35, 'max': 0.50},
+        'damage_occurrence_rate': {'min': 0.03, 'mode': 0.08, 'max': 0.15},
+        'average_damage_value': PARAMS['average_damage_value']
+    }
+}
 
-def run_monte_carlo_simulation(params=PARAMS, n_sims=N_SIMULATIONS):
-    """Run Monte Carlo simulation for consumer harm"""
-    # Generate random samples for each parameter
-    service_costs = triangular_sample(
-        params['base_service_cost']['min'],
-        params['base_service_cost']['mode'],
-        params['base_service_cost']['max'],
-        n_sims
-    )
-    
-    hidden_fees = triangular_sample(
-        params['hidden_fees']['min'],
-        params['hidden_fees']['mode'],
-        params['hidden_fees']['max'],
-        n_sims
-    )
-    
-    service_failure_probs = triangular_sample(
-        params['service_failure_prob']['min'],
-        params['service_failure_prob']['mode'],
-        params['service_failure_prob']['max'],
-        n_sims
-    )
-    
-    claim_denial_probs = triangular_sample(
-        params['claim_denial_prob']['min'],
-        params['claim_denial_prob']['mode'],
-        params['claim_denial_prob']['max'],
-        n_sims
-    )
-    
-    damage_occurrence_rates = triangular_sample(
-        params['damage_occurrence_rate']['min'],
-        params['damage_occurrence_rate']['mode'],
-        params['damage_occurrence_rate']['max'],
-        n_sims
-    )
-    
-    damage_values = triangular_sample(
-        params['average_damage_value']['min'],
-        params['average_damage_value']['mode'],
-        params['average_damage_value']['max'],
-        n_sims
-    )
-    
-    # Simulate events
-    service_failures = np.random.random(n_sims) < service_failure_probs
-    damage_occurred = np.random.random(n_sims) < damage_occurrence_rates
-    claims_denied = np.random.random(n_sims) < claim_denial_probs
-    
-    # Calculate harm components
-    service_failure_harm = service_failures * SERVICE_FAILURE_PENALTY
-    damage_harm = damage_occurred * damage_values * claims_denied
+# Order in which parameters are sampled (one row per parameter)
+PARAM_ORDER = [
+    'base_service_cost',
+    'hidden_fees',
+    'service_failure_prob',
+    'claim_denial_prob',
+    'damage_occurrence_rate',
+    'average_damage_value'
+]
+
+def pack_parameters(params):
+    """Triangular (min, mode, max) bounds as a (len(PARAM_ORDER), 3) SIM_DTYPE array"""
+    return np.array([[params[name]['min'], params[name]['mode'], params[name]['max']]
+                     for name in PARAM_ORDER], dtype=SIM_DTYPE)
+
+# Packed once at import, so simulations never touch the parameter dicts
+PACKED_PARAMS = pack_parameters(PARAMS)
+PACKED_SCENARIOS = {name: pack_parameters(params) for name, params in SCENARIOS.items()}
+
+if njit is not None:
+    # No fastmath: it lets LLVM contract and reorder float32 arithmetic, and the kernel
+    # must round exactly like the NumPy fallback
+    @njit(parallel=True, cache=True)
+    def _mc_kernel(bounds, uniforms, event_bits, penalty, samples, events, service_failure_harm,
+                   damage_harm, total_harm):
+        """
+        Whole simulation in one parallel pass per customer: triangular inverse CDF for each
+        parameter, the three Bernoulli events and the harm components. `bounds` is
+        (n_sets, n_params, 3); the other arrays have the set and customer axes flattened.
+        """
+        n_sets, n_params = bounds.shape[0], bounds.shape[1]
+        n_sims = total_harm.shape[0] // n_sets
+        for i in prange(total_harm.shape[0]):
+            param_set = i // n_sims
+            for p in range(n_params):
+                low, mode, high = bounds[param_set, p, 0], bounds[param_set, p, 1], bounds[param_set, p, 2]
+                span = high - low
+                split = (mode - low) / span
+                u = uniforms[p, i]
+                if u < split:
+                    samples[p, i] = low + span * np.sqrt(u * split)
+                else:
+                    samples[p, i] = high - span * np.sqrt((np.float32(1) - u) * (np.float32(1) - split))
+            
+            # Event order: service failure, damage occurred, claim denied
+            service_failure = event_bits[0, i] < np.uint32(min(np.float64(samples[2, i]) * EVENT_SCALE, EVENT_MAX))
+            damage_occurred = event_bits[1, i] < np.uint32(min(np.float64(samples[4, i]) * EVENT_SCALE, EVENT_MAX))
+            claim_denied = event_bits[2, i] < np.uint32(min(np.float64(samples[3, i]) * EVENT_SCALE, EVENT_MAX))
+            events[0, i] = service_failure
+            events[1, i] = damage_occurred
+            events[2, i] = claim_denied
+            
+            service_failure_harm[i] = penalty if service_failure else np.float32(0)
+            damage_harm[i] = samples[5, i] if damage_occurred and claim_denied else np.float32(0)
+            total_harm[i] = samples[1, i] + service_failure_harm[i] + damage_harm[i]
+
+def _triangular_inverse_cdf(u, low, mode, high):
+    """Map uniforms on [0, 1) to triangular(low, mode, high) samples"""
+    span = high - low
+    split = (mode - low) / span
+    return np.where(u < split,
+                    low + span * np.sqrt(u * split),
+                    high - span * np.sqrt((1 - u) * (1 - split)))
+
+def _event_thresholds(probs):
+    """uint32 thresholds such that a uniform uint32 draw falls below them with probability `probs`"""
+    return np.minimum(probs.astype(np.float64) * EVENT_SCALE, EVENT_MAX).astype(np.uint32)
+
+def allocate_workspace(n_sims=N_SIMULATIONS, n_sets=1):
+    """Scratch buffer for the uniform draws, reusable across simulate_batch calls of up to this size"""
+    return np.empty(len(PARAM_ORDER) * n_sets * n_sims, dtype=SIM_DTYPE)
+
+def simulate_batch(bounds, n_sims=N_SIMULATIONS, rng=None, workspace=None):
+    """
+    Run the simulation for several parameter sets at once, given their packed bounds
+    stacked as (n_sets, len(PARAM_ORDER), 3); each returned array has shape
+    (n_sets, n_sims). All randomness comes from one block of uniforms (one row per
+    parameter) and one block of raw uint32 event draws (one row per event), which
+    either the Numba kernel or the NumPy fallback turns into bit-identical results.
+    Draws come from `rng`, or the module-level RNG by default; `rng` may also be a
+    sequence of Generators, one per parameter set, each set then drawing exactly what
+    it would draw if simulated alone. The uniforms are written into `workspace`
+    (see allocate_workspace) when one is given
+    """
+    rng = RNG if rng is None else rng
+    n_sets = len(bounds)
+    uniform_shape = (len(PARAM_ORDER), n_sets, n_sims)
+    n_uniforms = len(PARAM_ORDER) * n_sets * n_sims
+    if workspace is None:
+        uniforms = np.empty(uniform_shape, dtype=SIM_DTYPE)
+    elif workspace.dtype != SIM_DTYPE or workspace.size < n_uniforms:
+        raise ValueError(f"workspace must be a {np.dtype(SIM_DTYPE).name} array "
+                         f"with at least {n_uniforms:,} elements")
+    else:
+        uniforms = workspace.reshape(-1)[:n_uniforms].reshape(uniform_shape)
+    if isinstance(rng, np.random.Generator):
+        rng.random(out=uniforms, dtype=SIM_DTYPE)
+        event_bits = rng.integers(0, 1 << 32, size=(3, n_sets, n_sims), dtype=np.uint32)
+    else:
+        if len(rng) != n_sets:
+            raise ValueError(f"expected one Generator per parameter set ({n_sets}), got {len(rng)}")
+        # Each stream fills its set's rows in the order a single-set batch would
+        event_bits = np.empty((3, n_sets, n_sims), dtype=np.uint32)
+        for i, stream in enumerate(rng):
+            for row in uniforms[:, i]:
+                stream.random(out=row, dtype=SIM_DTYPE)
+            event_bits[:, i] = stream.integers(0, 1 << 32, size=(3, n_sims), dtype=np.uint32)
     
-    # Total harm per customer
-    total_harm = hidden_fees + service_failure_harm + damage_harm
+    if njit is not None:
+        samples = np.empty((len(PARAM_ORDER), n_sets * n_sims), dtype=SIM_DTYPE)
+        events = np.empty((3, n_sets * n_sims), dtype=np.bool_)
+        service_failure_harm = np.empty(n_sets * n_sims, dtype=SIM_DTYPE)
+        damage_harm = np.empty(n_sets * n_sims, dtype=SIM_DTYPE)
+        total_harm = np.empty(n_sets * n_sims, dtype=SIM_DTYPE)
+        _mc_kernel(bounds, uniforms.reshape(len(PARAM_ORDER), -1), event_bits.reshape(3, -1),
+                   SIM_DTYPE(SERVICE_FAILURE_PENALTY), samples, events, service_failure_harm,
+                   damage_harm, total_harm)
+        
+        shape = (n_sets, n_sims)
+        (service_costs, hidden_fees, service_failure_probs, claim_denial_probs,
+         damage_occurrence_rates, damage_values) = samples.reshape((len(PARAM_ORDER),) + shape)
+        service_failures, damage_occurred, claims_denied = events.reshape((3,) + shape)
+        service_failure_harm = service_failure_harm.reshape(shape)
+        damage_harm = damage_harm.reshape(shape)
+        total_harm = total_harm.reshape(shape)
+    else:
+        # Bounds broadcast as (n_params, n_sets, 1) over the simulations
+        low, mode, high = bounds.transpose(2, 1, 0)[:, :, :, None]
+        (service_costs, hidden_fees, service_failure_probs, claim_denial_probs,
+         damage_occurrence_rates, damage_values) = _triangular_inverse_cdf(
+            uniforms, low, mode, high
+        )
+        
+        # Simulate events
+        service_failures = event_bits[0] < _event_thresholds(service_failure_probs)
+        damage_occurred = event_bits[1] < _event_thresholds(damage_occurrence_rates)
+        claims_denied = event_bits[2] < _event_thresholds(claim_denial_probs)
+        
+        # Calculate harm components
+        service_failure_harm = service_failures * SIM_DTYPE(SERVICE_FAILURE_PENALTY)
+        damage_harm = damage_occurred * damage_values * claims_denied
+        
+        # Total harm per customer
+        total_harm = hidden_fees + service_failure_harm + damage_harm
     
-    # Create results dataframe
-    results = pd.DataFrame({
+    return {
         'service_cost': service_costs,
         'hidden_fees': hidden_fees,
         'service_failure': service_failures,
@@ -107,43 +237,107 @@ def run_monte_carlo_simulation(params=PARAMS, n_sims=N_SIMULATIONS):
         'claim_denied': claims_denied,
         'damage_harm': damage_harm,
         'total_harm': total_harm
-    })
+    }
+
+def _batch_results(batch, index):
+    """
+    One parameter set's results from a simulate_batch result, as a dict of column
+    name -> 1-D array (views into the batch; no copies)
+    """
+    return {column: values[index] for column, values in batch.items()}
+
+def run_monte_carlo_simulation(bounds=PACKED_PARAMS, n_sims=N_SIMULATIONS, rng=None,
+                               workspace=None):
+    """
+    Run Monte Carlo simulation for consumer harm, for parameters packed with
+    pack_parameters. Results are kept as a dict of NumPy arrays; build a DataFrame
+    from it only where one is needed for export
+    """
+    return _batch_results(simulate_batch(bounds[np.newaxis], n_sims, rng, workspace), 0)
+
+def run_scenarios(scenarios=PACKED_SCENARIOS, n_sims=N_SIMULATIONS, rng=None, n_workers=1,
+                  workspace=None):
+    """
+    Run all scenarios ({name: packed parameters}), returning results by scenario name.
+    Each scenario draws from its own stream spawned from `rng`, so the results are
+    the same whether the scenarios are simulated together in one in-process batch or,
+    with n_workers > 1, each in its own process (only the result arrays are sent back;
+    worker processes allocate their own scratch space, so `workspace` is only used in-process)
+    """
+    rng = RNG if rng is None else rng
+    streams = rng.spawn(len(scenarios))
+    n_workers = min(n_workers, len(scenarios))
+    if n_workers <= 1:
+        batch = simulate_batch(np.stack(list(scenarios.values())), n_sims, streams, workspace)
+        return {name: _batch_results(batch, i) for i, name in enumerate(scenarios)}
     
-    return results
+    # 'spawn' rather than fork: forking after Numba has started its thread pool can deadlock
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+        batches = executor.map(simulate_batch, [bounds[np.newaxis] for bounds in scenarios.values()],
+                               repeat(n_sims), streams)
+        return {name: _batch_results(batch, 0) for name, batch in zip(scenarios, batches)}
+
+# Percentiles reported in the percentile sheet; the chart shows those from the 10th up
+PERCENTILES = np.array([1, 5, 10, 25, 50, 75, 90, 95, 99])
+
+def harm_percentiles(results):
+    """Total harm at each of PERCENTILES, from one np.quantile call"""
+    return np.quantile(results['total_harm'].astype(np.float64), PERCENTILES / 100)
 
 def calculate_statistics(results):
     """Calculate key statistics from simulation results"""
     harm = results['total_harm']
     
+    # All quantiles (median included) from one np.quantile call, interpolated in float64
+    p10, p25, median, p75, p90, p95, p99 = np.quantile(
+        harm.astype(np.float64), [0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99]
+    )
+    mean_harm = harm.mean(dtype=np.float64)
+    
+    # Threshold counts: one vectorized comparison each, faster than np.histogram,
+    # which falls back to a binary search per value for non-uniform edges
+    n_zero = np.count_nonzero(harm == 0)
+    n_over_1000 = np.count_nonzero(harm > 1000)
+    n_over_5000 = np.count_nonzero(harm > 5000)
+    
     stats_dict = {
-        'Mean Harm': harm.mean(),
-        'Median Harm': harm.median(),
-        'Std Dev': harm.std(),
-        'Min Harm': harm.min(),
-        'Max Harm': harm.max(),
-        '10th Percentile': harm.quantile(0.10),
-        '25th Percentile': harm.quantile(0.25),
-        '75th Percentile': harm.quantile(0.75),
-        '90th Percentile': harm.quantile(0.90),
-        '95th Percentile': harm.quantile(0.95),
-        '99th Percentile': harm.quantile(0.99),
-        'Customers with Zero Harm': (harm == 0).sum(),
-        'Customers with Harm > $1000': (harm > 1000).sum(),
-        'Customers with Harm > $5000': (harm > 5000).sum(),
-        '% with Zero Harm': (harm == 0).sum() / len(harm) * 100,
-        '% with Harm > $1000': (harm > 1000).sum() / len(harm) * 100,
-        '% with Harm > $5000': (harm > 5000).sum() / len(harm) * 100,
-        'Annual Industry Impact (Mean)': harm.mean() * ANNUAL_TRANSACTIONS,
-        'Annual Industry Impact (95th %ile)': harm.quantile(0.95) * ANNUAL_TRANSACTIONS
+        'Mean Harm': mean_harm,
+        'Median Harm': median,
+        'Std Dev': harm.std(ddof=1, dtype=np.float64),
+        'Min Harm': float(harm.min()),
+        'Max Harm': float(harm.max()),
+        '10th Percentile': p10,
+        '25th Percentile': p25,
+        '75th Percentile': p75,
+        '90th Percentile': p90,
+        '95th Percentile': p95,
+        '99th Percentile': p99,
+        'Customers with Zero Harm': n_zero,
+        'Customers with Harm > $1000': n_over_1000,
+        'Customers with Harm > $5000': n_over_5000,
+        '% with Zero Harm': n_zero / len(harm) * 100,
+        '% with Harm > $1000': n_over_1000 / len(harm) * 100,
+        '% with Harm > $5000': n_over_5000 / len(harm) * 100,
+        'Annual Industry Impact (Mean)': mean_harm * ANNUAL_TRANSACTIONS,
+        'Annual Industry Impact (95th %ile)': p95 * ANNUAL_TRANSACTIONS
     }
     
     return stats_dict
 
-def create_excel_report(results, stats, scenario_results, output_dir):
-    """Create Excel report with basic pandas functionality"""
+def create_excel_report(results, stats, scenario_results, output_dir, percentile_values=None):
+    """
+    Create Excel report with basic pandas functionality. Pass `percentile_values`
+    from harm_percentiles to reuse ones already computed
+    """
+    if percentile_values is None:
+        percentile_values = harm_percentiles(results)
     excel_file = os.path.join(output_dir, "Consumer_Harm_Analysis.xlsx")
     
-    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+    # xlsxwriter writes the sheets far faster than openpyxl. Its constant_memory mode is
+    # not used: to_excel fills each sheet column by column, and constant_memory silently
+    # drops any cell written to a row that has already been flushed
+    with pd.ExcelWriter(excel_file, engine='xlsxwriter') as writer:
         # Executive Summary
         summary_data = {
             'Metric': [
@@ -168,15 +362,20 @@ def create_excel_report(results, stats, scenario_results, output_dir):
         summary_df = pd.DataFrame(summary_data)
         summary_df.to_excel(writer, sheet_name='Executive Summary', index=False)
         
-        # Detailed Results (first 1000)
-        results.head(1000).to_excel(writer, sheet_name='Detailed Results', index=False)
+        # Detailed Results (first 1000), written straight from the result arrays with
+        # one xlsxwriter write_column call per column rather than through to_excel
+        ws = writer.book.add_worksheet('Detailed Results')
+        header_format = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center',
+                                                'valign': 'top'})  # pandas' header style
+        ws.write_row(0, 0, list(results), header_format)
+        for col, values in enumerate(results.values()):
+            ws.write_column(1, col, values[:1000].tolist())
         
         # Percentile Analysis
-        percentiles = [1, 5, 10, 25, 50, 75, 90, 95, 99]
         percentile_data = {
-            'Percentile': [f"{p}th" for p in percentiles],
-            'Harm Amount': [results['total_harm'].quantile(p/100) for p in percentiles],
-            '% of Customers': percentiles
+            'Percentile': [f"{p}th" for p in PERCENTILES],
+            'Harm Amount': percentile_values,
+            '% of Customers': PERCENTILES
         }
         percentile_df = pd.DataFrame(percentile_data)
         percentile_df.to_excel(writer, sheet_name='Percentile Analysis', index=False)
@@ -185,14 +384,14 @@ def create_excel_report(results, stats, scenario_results, output_dir):
         components_data = {
             'Component': ['Hidden Fees', 'Service Failures', 'Damages (Denied Claims)'],
             'Mean': [
-                results['hidden_fees'].mean(),
-                results['service_failure_harm'].mean(),
-                results['damage_harm'].mean()
+                results['hidden_fees'].mean(dtype=np.float64),
+                results['service_failure_harm'].mean(dtype=np.float64),
+                results['damage_harm'].mean(dtype=np.float64)
             ],
             'Median': [
-                results['hidden_fees'].median(),
-                results['service_failure_harm'].median(),
-                results['damage_harm'].median()
+                np.median(results['hidden_fees']),
+                np.median(results['service_failure_harm']),
+                np.median(results['damage_harm'])
             ],
             'Max': [
                 results['hidden_fees'].max(),
@@ -234,6 +433,12 @@ def create_output_directory():
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Consumer harm Monte Carlo simulation")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for the scenario analysis (default: 1, in-process; "
+                             "only worth it for very large runs)")
+    args = parser.parse_args()
+    
     print("="*60)
     print("CONSUMER HARM MONTE CARLO SIMULATION")
     print("Standalone Version - Railway Deployment")
@@ -245,8 +450,11 @@ def main():
     
     # Run base simulation
     print(f"Step 1: Running base simulation with {N_SIMULATIONS:,} iterations...")
-    results = run_monte_carlo_simulation()
+    # One scratch buffer for the uniform draws, shared by every simulation of the run
+    workspace = allocate_workspace(N_SIMULATIONS, len(PACKED_SCENARIOS))
+    results = run_monte_carlo_simulation(workspace=workspace)
     stats = calculate_statistics(results)
+    percentile_values = harm_percentiles(results)
     
     print("✓ Base simulation complete")
     print(f"  - Mean harm: ${stats['Mean Harm']:,.2f}")
@@ -255,53 +463,45 @@ def main():
     
     # Run scenario analysis
     print("\nStep 2: Running scenario analysis...")
-    scenarios = {
-        'Status Quo': PARAMS,
-        'Moderate Reform': {
-            'base_service_cost': PARAMS['base_service_cost'],
-            'hidden_fees': {'min': 0, 'mode': 150, 'max': 500},
-            'service_failure_prob': {'min': 0.10, 'mode': 0.20, 'max': 0.30},
-            'claim_denial_prob': {'min': 0.40, 'mode': 0.60, 'max': 0.80},
-            'damage_occurrence_rate': PARAMS['damage_occurrence_rate'],
-            'average_damage_value': PARAMS['average_damage_value']
-        },
-        'Strong Reform': {
-            'base_service_cost': PARAMS['base_service_cost'],
-            'hidden_fees': {'min': 0, 'mode': 50, 'max': 200},
-            'service_failure_prob': {'min': 0.05, 'mode': 0.10, 'max': 0.15},
-            'claim_denial_prob': {'min': 0.20, 'mode': 0.35, 'max': 0.50},
-            'damage_occurrence_rate': {'min': 0.03, 'mode': 0.08, 'max': 0.15},
-            'average_damage_value': PARAMS['average_damage_value']
-        }
-    }
-    
+    # A scenario with the base parameters (Status Quo) reuses the base simulation
+    # rather than simulating the same parameters a second time
     scenario_results = {}
-    for scenario_name, scenario_params in scenarios.items():
-        print(f"  - Running {scenario_name} scenario...")
-        scenario_res = run_monte_carlo_simulation(scenario_params, n_sims=N_SIMULATIONS)
-        scenario_stats = calculate_statistics(scenario_res)
-        scenario_results[scenario_name] = {
-            'results': scenario_res,
-            'stats': scenario_stats
-        }
+    to_simulate = {}
+    for scenario_name, bounds in PACKED_SCENARIOS.items():
+        if np.array_equal(bounds, PACKED_PARAMS):
+            print(f"  - Reusing base simulation for {scenario_name} scenario...")
+            scenario_results[scenario_name] = {'results': results, 'stats': stats}
+        else:
+            to_simulate[scenario_name] = bounds
+    
+    if to_simulate:
+        for scenario_name, scenario_res in run_scenarios(to_simulate, n_sims=N_SIMULATIONS,
+                                                         n_workers=args.workers,
+                                                         workspace=workspace).items():
+            print(f"  - Summarizing {scenario_name} scenario...")
+            scenario_stats = calculate_statistics(scenario_res)
+            scenario_results[scenario_name] = {
+                'results': scenario_res,
+                'stats': scenario_stats
+            }
+    
+    # Keep the scenarios in their defined order
+    scenario_results = {name: scenario_results[name] for name in PACKED_SCENARIOS}
     
     print("✓ Scenario analysis complete")
     
     # Generate visualizations
     print("\nStep 3: Generating visualizations...")
     try:
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-interactive backend
-        
         # Create summary visualization
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
         # 1. Histogram of total harm
         ax1.hist(results['total_harm'], bins=50, color='steelblue', alpha=0.7, edgecolor='black')
-        ax1.axvline(results['total_harm'].mean(), color='red', linestyle='--', linewidth=2, 
-                    label=f'Mean: ${results["total_harm"].mean():.0f}')
-        ax1.axvline(results['total_harm'].median(), color='green', linestyle='--', linewidth=2, 
-                    label=f'Median: ${results["total_harm"].median():.0f}')
+        ax1.axvline(stats['Mean Harm'], color='red', linestyle='--', linewidth=2, 
+                    label=f'Mean: ${stats["Mean Harm"]:.0f}')
+        ax1.axvline(stats['Median Harm'], color='green', linestyle='--', linewidth=2, 
+                    label=f'Median: ${stats["Median Harm"]:.0f}')
         ax1.set_xlabel('Total Consumer Harm ($)')
         ax1.set_ylabel('Frequency')
         ax1.set_title('Distribution of Consumer Harm')
@@ -309,7 +509,7 @@ def main():
         ax1.grid(True, alpha=0.3)
         
         # 2. Scenario comparison
-        scenarios_list = list(scenarios.keys())
+        scenarios_list = list(SCENARIOS.keys())
         mean_harms = [scenario_results[s]['stats']['Mean Harm'] for s in scenarios_list]
         colors = ['red', 'orange', 'green']
         
@@ -321,21 +521,22 @@ def main():
                      f'${harm:.0f}', ha='center')
         
         # 3. Percentile chart
-        percentiles = [10, 25, 50, 75, 90, 95, 99]
-        percentile_values = [results['total_harm'].quantile(p/100) for p in percentiles]
+        shown = PERCENTILES >= 10
+        chart_percentiles = PERCENTILES[shown]
+        chart_values = percentile_values[shown]
         
-        ax3.bar([str(p) + 'th' for p in percentiles], percentile_values, color='coral')
+        ax3.bar([str(p) + 'th' for p in chart_percentiles], chart_values, color='coral')
         ax3.set_xlabel('Percentile')
         ax3.set_ylabel('Harm Amount ($)')
         ax3.set_title('Consumer Harm by Percentile')
-        for i, v in enumerate(percentile_values):
+        for i, v in enumerate(chart_values):
             ax3.text(i, v + 50, f'${v:.0f}', ha='center', va='bottom', fontsize=8)
         
         # 4. Component breakdown
         component_means = [
-            results['hidden_fees'].mean(),
-            results['service_failure_harm'].mean(),
-            results['damage_harm'].mean()
+            results['hidden_fees'].mean(dtype=np.float64),
+            results['service_failure_harm'].mean(dtype=np.float64),
+            results['damage_harm'].mean(dtype=np.float64)
         ]
         labels = ['Hidden Fees', 'Service Failures', 'Damages (Denied)']
         colors_pie = ['#ff9999', '#66b3ff', '#99ff99']
@@ -354,7 +555,8 @@ def main():
     # Generate Excel report
     print("\nStep 4: Generating Excel report...")
     try:
-        excel_file = create_excel_report(results, stats, scenario_results, output_dir)
+        excel_file = create_excel_report(results, stats, scenario_results, output_dir,
+                                         percentile_values)
         print("✓ Excel report generated")
     except Exception as e:
         print(f"⚠ Excel generation error: {str(e)}")
@@ -362,7 +564,18 @@ def main():
     
     # Save raw data
     print("\nStep 5: Saving raw data...")
-    results.to_csv(os.path.join(output_dir, 'monte_carlo_raw_data.csv'), index=False)
+    csv_file = os.path.join(output_dir, 'monte_carlo_raw_data.csv')
+    # Event flags as 0/1 and a plain header line, so both writers give the same layout
+    columns = {name: values.astype(np.int8) if values.dtype == bool else values
+               for name, values in results.items()}
+    if pa is not None:
+        # Arrow's multithreaded C++ writer, straight from the result arrays; the header
+        # is written separately because Arrow quotes column names
+        with open(csv_file, 'wb') as f:
+            f.write((','.join(columns) + '\n').encode())
+            pa_csv.write_csv(pa.table(columns), f, pa_csv.WriteOptions(include_header=False))
+    else:
+        pd.DataFrame(columns).to_csv(csv_file, index=False)
     
     # Create summary report
     summary_file = os.path.join(output_dir, 'simulation_summary.txt')
@@ -0,0 +1,115 @@
+"""Seeded checks for the core simulation module's fast paths against reference results"""
+
+import numpy as np
+import pytest
+
+import consumer_harm_monte_carlo as chmc
+
+N_SIMS = 50_000
+SEED = 20240601
+
+
+def simulate(n_sims=N_SIMS, seed=SEED, **kwargs):
+    return chmc.run_monte_carlo_simulation(n_sims=n_sims, seed=seed, **kwargs)
+
+
+def test_csv_same_with_and_without_pyarrow(tmp_path, monkeypatch):
+    if chmc.pa is None:
+        pytest.skip("pyarrow is not installed")
+    results = simulate()
+    results.to_csv(tmp_path / 'arrow.csv')
+    monkeypatch.setattr(chmc, 'pa', None)
+    results.to_csv(tmp_path / 'fallback.csv')
+
+    written = (tmp_path / 'fallback.csv').read_bytes()
+    assert written == (tmp_path / 'arrow.csv').read_bytes()
+    header, first_row = written.decode().splitlines()[:2]
+    assert header == ','.join(chmc.SimResults.COLUMNS)
+    assert np.float32(first_row.split(',')[-1]) == results['total_harm'][0]
+
+
+@pytest.mark.skipif(chmc.njit is None, reason="numba is not installed")
+@pytest.mark.parametrize('fused', [False, True])
+def test_numba_kernels_match_numpy_fallback(monkeypatch, fused):
+    fast = chmc.simulate_scenarios(chmc.SCENARIOS, n_sims=N_SIMS, seed=SEED, fused=fused)
+    monkeypatch.setattr(chmc, 'njit', None)
+    reference = chmc.simulate_scenarios(chmc.SCENARIOS, n_sims=N_SIMS, seed=SEED)
+
+    for name, results in reference.items():
+        for column, values in results.columns().items():
+            np.testing.assert_array_equal(fast[name][column], values, err_msg=f"{name}: {column}")
+
+
+def test_quantiles_from_sorted_matches_np_quantile():
+    rng = np.random.default_rng(SEED)
+    qs = [0.0, 0.01, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99, 1.0]
+    for values in (rng.gamma(2.0, 500.0, size=10_001).astype(np.float32),
+                   rng.integers(0, 5, size=1_000).astype(np.float32),  # many ties
+                   np.array([7.0], dtype=np.float32)):
+        np.testing.assert_allclose(chmc.quantiles_from_sorted(np.sort(values), qs),
+                                   np.quantile(values.astype(np.float64), qs), rtol=1e-12)
+
+
+def test_statistics_order_statistics_match_np_quantile():
+    results = simulate()
+    stats = chmc.calculate_statistics(results)
+    harm = results['total_harm'].astype(np.float64)
+    for key, q in [('Min Harm', 0.0), ('10th Percentile', 0.10), ('Median Harm', 0.50),
+                   ('95th Percentile', 0.95), ('99th Percentile', 0.99), ('Max Harm', 1.0)]:
+        np.testing.assert_allclose(stats[key], np.quantile(harm, q), rtol=1e-12, err_msg=key)
+    np.testing.assert_array_equal(results.sorted_harm, np.sort(results['total_harm']))
+
+
+def test_threshold_counts_match_boolean_sums():
+    results = simulate()
+    # Values exactly on each threshold must not count as exceeding it
+    results.total_harm[:4] = [0.0, 0.0, 1000.0, 5000.0]
+    stats = chmc.calculate_statistics(results)
+    harm = results['total_harm']
+    assert stats['Customers with Zero Harm'] == np.sum(harm == 0)
+    assert stats['Customers with Harm > $1000'] == np.sum(harm > 1000)
+    assert stats['Customers with Harm > $5000'] == np.sum(harm > 5000)
+
+
+def test_streaming_statistics_match_in_memory_statistics():
+    """A single block draws exactly what the in-memory run draws, so everything but the
+    histogram-based quantiles must agree"""
+    streamed = chmc.calculate_streaming_statistics(n_sims=N_SIMS, block=N_SIMS, seed=SEED)
+    reference = chmc.calculate_statistics(simulate())
+    histogram_quantiles = {'10th Percentile', '25th Percentile', 'Median Harm', '75th Percentile',
+                           '90th Percentile', '95th Percentile', '99th Percentile'}
+    for key, value in reference.items():
+        if key in histogram_quantiles:
+            assert abs(streamed[key] - value) <= chmc.STREAM_BIN_WIDTH, key
+        elif key != 'Annual Industry Impact (95th %ile)':
+            np.testing.assert_allclose(streamed[key], value, rtol=1e-12, err_msg=key)
+
+def test_streaming_statistics_merge_blocks_exactly():
+    block = 4_096  # does not divide N_SIMS, so the last block is short
+    streamed = chmc.calculate_streaming_statistics(n_sims=N_SIMS, block=block, seed=SEED)
+    harm = np.concatenate(list(chmc.simulate_streaming(n_sims=N_SIMS, block=block, seed=SEED)))
+    harm = harm.astype(np.float64)
+    np.testing.assert_allclose(streamed['Mean Harm'], harm.mean(), rtol=1e-12)
+    np.testing.assert_allclose(streamed['Std Dev'], harm.std(ddof=1), rtol=1e-12)
+    assert streamed['Min Harm'] == harm.min() and streamed['Max Harm'] == harm.max()
+    assert streamed['Customers with Harm > $1000'] == np.sum(harm > 1000)
+    for key, q in [('10th Percentile', 0.10), ('Median Harm', 0.50), ('99th Percentile', 0.99)]:
+        assert abs(streamed[key] - np.quantile(harm, q)) <= chmc.STREAM_BIN_WIDTH, key
+
+
+@pytest.mark.parametrize('chunk_size', [10_000, 7_001])
+def test_results_independent_of_worker_count(monkeypatch, chunk_size):
+    """Chunks get their streams by position, so any number of workers gives the same output"""
+    monkeypatch.setattr(chmc, 'CHUNK_SIZE', chunk_size)
+    in_process = simulate(n_sims=30_001)
+    pooled = simulate(n_sims=30_001, n_workers=3)
+    for column, values in in_process.columns().items():
+        np.testing.assert_array_equal(pooled[column], values, err_msg=column)
+
+
+def test_runs_within_one_chunk_draw_straight_from_rng(monkeypatch):
+    monkeypatch.setattr(chmc, 'CHUNK_SIZE', N_SIMS)
+    results = simulate(n_workers=4)
+    bounds = chmc.pack_parameters(chmc.PARAMS)
+    reference = chmc._simulate_chunk(bounds, N_SIMS, chmc.make_rng(SEED))
+    np.testing.assert_array_equal(results['total_harm'], reference['total_harm'])
@@ -0,0 +1,89 @@
+"""Seeded checks that main.py's fast simulation path matches reference results"""
+
+import numpy as np
+import pytest
+
+import main
+
+N_SIMS = 200_000
+SEED = 20240601
+
+
+def simulate(n_sims=N_SIMS, seed=SEED):
+    return main.run_monte_carlo_simulation(n_sims=n_sims, rng=np.random.default_rng(seed))
+
+
+def test_statistics_match_reference():
+    """calculate_statistics agrees with plain float64 NumPy on the same draws"""
+    results = simulate()
+    stats = main.calculate_statistics(results)
+    harm = results['total_harm'].astype(np.float64)
+
+    np.testing.assert_allclose(stats['Mean Harm'], harm.mean(), rtol=1e-9)
+    np.testing.assert_allclose(stats['Std Dev'], harm.std(ddof=1), rtol=1e-9)
+    np.testing.assert_allclose(stats['Median Harm'], np.median(harm), rtol=1e-9)
+    np.testing.assert_allclose(stats['95th Percentile'], np.percentile(harm, 95), rtol=1e-9)
+    np.testing.assert_allclose(main.harm_percentiles(results),
+                               np.percentile(harm, main.PERCENTILES), rtol=1e-9)
+    assert stats['Customers with Zero Harm'] == (harm == 0).sum()
+    assert stats['Customers with Harm > $1000'] == (harm > 1000).sum()
+    assert stats['Customers with Harm > $5000'] == (harm > 5000).sum()
+
+
+def test_harm_components_add_up():
+    results = simulate()
+    np.testing.assert_allclose(
+        results['total_harm'],
+        results['hidden_fees'] + results['service_failure_harm'] + results['damage_harm'],
+        rtol=1e-6
+    )
+    np.testing.assert_array_equal(results['service_failure_harm'] > 0, results['service_failure'])
+
+
+@pytest.mark.parametrize('name', list(main.SCENARIOS))
+def test_sample_and_event_means(name):
+    """Sample means and event frequencies match the triangular distributions' means"""
+    params = main.SCENARIOS[name]
+    results = main.run_monte_carlo_simulation(main.PACKED_SCENARIOS[name], n_sims=N_SIMS,
+                                              rng=np.random.default_rng(SEED))
+
+    def triangular_mean(param):
+        return (params[param]['min'] + params[param]['mode'] + params[param]['max']) / 3
+
+    np.testing.assert_allclose(results['service_cost'].mean(dtype=np.float64),
+                               triangular_mean('base_service_cost'), rtol=0.005)
+    np.testing.assert_allclose(results['hidden_fees'].mean(dtype=np.float64),
+                               triangular_mean('hidden_fees'), rtol=0.01)
+    for column, param in [('service_failure', 'service_failure_prob'),
+                          ('damage_occurred', 'damage_occurrence_rate'),
+                          ('claim_denied', 'claim_denial_prob')]:
+        np.testing.assert_allclose(results[column].mean(), triangular_mean(param), atol=0.005)
+
+
+@pytest.mark.skipif(main.njit is None, reason="numba is not installed")
+def test_numba_kernel_matches_numpy_fallback(monkeypatch):
+    fast = simulate()
+    monkeypatch.setattr(main, 'njit', None)
+    reference = simulate()
+
+    for column, values in reference.items():
+        np.testing.assert_array_equal(fast[column], values, err_msg=column)
+
+
+def test_scenario_results_independent_of_batching():
+    """run_scenarios gives each scenario its own spawned stream, however they are run"""
+    batched = main.run_scenarios(n_sims=10_000, rng=np.random.default_rng(SEED),
+                                 workspace=main.allocate_workspace(10_000, len(main.PACKED_SCENARIOS)))
+    streams = np.random.default_rng(SEED).spawn(len(main.PACKED_SCENARIOS))
+    for (name, bounds), stream in zip(main.PACKED_SCENARIOS.items(), streams):
+        single = main.run_monte_carlo_simulation(bounds, n_sims=10_000, rng=stream)
+        for column, values in single.items():
+            np.testing.assert_array_equal(batched[name][column], values, err_msg=column)
+
+
+def test_scenario_results_independent_of_workers():
+    in_process = main.run_scenarios(n_sims=10_000, rng=np.random.default_rng(SEED))
+    pooled = main.run_scenarios(n_sims=10_000, rng=np.random.default_rng(SEED), n_workers=2)
+    for name, results in in_process.items():
+        for column, values in results.items():
+            np.testing.assert_array_equal(pooled[name][column], values, err_msg=column)